@@ -1,14 +1,34 @@
 """Workspace integrity audit functions for detecting cross-contamination."""
 
+import functools
 import json
+import os
 import re
 import subprocess
+from collections import Counter
+from collections.abc import Iterable
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from .database import get_connection
 
+# Tags suggesting a task belongs to a different project
+_SUSPICIOUS_TAGS: frozenset[str] = frozenset({
+    "other-project",
+    "another-workspace",
+    "different-repo",
+    "task-viewer",  # Known separate project
+})
+
+# Columns the checks read; unused columns such as workspace_metadata and
+# entity metadata are never fetched
+_TASK_AUDIT_COLUMNS = "id, title, description, file_references, tags"
+_ENTITY_AUDIT_COLUMNS = "id, entity_type, name, identifier"
+
+# Absolute paths (Unix and Windows) mentioned in free text
+_ABSOLUTE_PATH_RE = re.compile(r"(?:/[\w\-./]+|[A-Z]:\\[\w\-\\./]+)")
+
 
 def perform_workspace_audit(
     workspace_path: str,
@@ -51,12 +71,16 @@ def perform_workspace_audit(
 
         # Get all tasks
         deleted_filter = "" if include_deleted else "WHERE deleted_at IS NULL"
-        cursor.execute(f"SELECT * FROM tasks {deleted_filter}")
+        cursor.execute(f"SELECT {_TASK_AUDIT_COLUMNS} FROM tasks {deleted_filter}")
         tasks: list[dict[str, Any]] = [dict(row) for row in cursor.fetchall()]
         report["total_tasks"] = len(tasks)
 
+        # Decode file_references once; checks 1 and 5 both read the result
+        for task in tasks:
+            task["_file_refs"] = _load_file_refs(task.get("file_references"))
+
         # Get all entities
-        cursor.execute(f"SELECT * FROM entities {deleted_filter}")
+        cursor.execute(f"SELECT {_ENTITY_AUDIT_COLUMNS} FROM entities {deleted_filter}")
         entities: list[dict[str, Any]] = [dict(row) for row in cursor.fetchall()]
         report["total_entities"] = len(entities)
 
@@ -92,32 +116,40 @@ def perform_workspace_audit(
 
     finally:
         conn.close()
+        # Memoized resolutions live for one audit only
+        _cached_resolve.cache_clear()
+        _dir_prefix.cache_clear()
 
 
 def _check_file_references(
-    tasks: list[dict[str, Any]],
+    tasks: Iterable[dict[str, Any]],
     workspace_path: str,
     report: dict[str, Any],
 ) -> None:
     """Check if task file_references point outside workspace."""
-    workspace_prefix = Path(workspace_path).resolve()
+    workspace_prefix = Path(_resolve(workspace_path))
 
     for task in tasks:
-        if not task.get("file_references"):
+        file_refs = _task_file_refs(task)
+        if not file_refs:
             continue
 
+        # Common case: all references share a directory inside the workspace,
+        # so one containment test clears the whole list. commonpath() runs on
+        # resolved refs so ".." segments and symlinks are still honoured; it
+        # raises ValueError on mixed drives, which falls through to the loop.
         try:
-            file_refs = json.loads(task["file_references"])
-        except json.JSONDecodeError:
-            continue
+            resolved_refs = [_resolve(ref) for ref in file_refs]
+            if _is_path_within(Path(os.path.commonpath(resolved_refs)), workspace_prefix):
+                continue
+        except (ValueError, OSError):
+            pass
 
         mismatched_refs: list[str] = []
         for ref in file_refs:
             try:
-                ref_path = Path(ref).resolve()
-
                 # Check if path is outside workspace
-                if not _is_path_within(ref_path, workspace_prefix):
+                if not _is_path_within(Path(ref), workspace_prefix):
                     mismatched_refs.append(ref)
             except (ValueError, OSError):
                 # Invalid path, skip
@@ -133,29 +165,49 @@ def _check_file_references(
             })
 
 
+def _load_file_refs(raw: str | None) -> list[str] | None:
+    """Decode a file_references column; None when the JSON is malformed."""
+    if not raw:
+        return []
+    # file_references is always a JSON array; reject anything else without
+    # paying for a JSONDecodeError
+    if raw.lstrip()[:1] != "[":
+        return None
+    try:
+        refs: list[str] = json.loads(raw)
+    except json.JSONDecodeError:
+        return None
+    return refs
+
+
+def _task_file_refs(task: dict[str, Any]) -> list[str] | None:
+    """Return a task's decoded file references, parsing only if not done yet."""
+    if "_file_refs" in task:
+        refs: list[str] | None = task["_file_refs"]
+        return refs
+    return _load_file_refs(task.get("file_references"))
+
+
 def _check_suspicious_tags(
-    tasks: list[dict[str, Any]],
+    tasks: Iterable[dict[str, Any]],
     workspace_path: str,  # noqa: ARG001
     report: dict[str, Any],
 ) -> None:
     """Check for tags that suggest different projects."""
-    # Common suspicious tag patterns
-    suspicious_patterns = [
-        r"\b(other-project|another-workspace|different-repo)\b",
-        r"\b\w+-mcp\b(?<!task-mcp)",  # Other MCP projects
-        r"\btask-viewer\b",  # Known separate project
-    ]
-
     for task in tasks:
         if not task.get("tags"):
             continue
 
         tags = task["tags"].lower()
-        reasons: list[str] = []
+        tokens = set(tags.split())
 
-        for pattern in suspicious_patterns:
-            if re.search(pattern, tags):
-                reasons.append(f"Pattern '{pattern}' suggests different workspace")
+        # Known names, plus any other *-mcp project
+        hits = tokens & _SUSPICIOUS_TAGS
+        hits.update(
+            tag for tag in tokens
+            if tag.endswith("-mcp") and len(tag) > 4 and not tag.endswith("task-mcp")
+        )
+        reasons = [f"Tag '{tag}' suggests different workspace" for tag in sorted(hits)]
 
         if reasons:
             report["issues"]["suspicious_tags"].append({
@@ -168,27 +220,23 @@ def _check_suspicious_tags(
 
 
 def _check_description_paths(
-    tasks: list[dict[str, Any]],
+    tasks: Iterable[dict[str, Any]],
     workspace_path: str,
     report: dict[str, Any],
 ) -> None:
     """Check task descriptions for absolute paths outside workspace."""
-    workspace_prefix = Path(workspace_path).resolve()
-
-    # Regex to find absolute paths (Unix and Windows)
-    path_pattern = r"(?:/[\w\-./]+|[A-Z]:\\[\w\-\\./]+)"
+    workspace_prefix = Path(_resolve(workspace_path))
 
     for task in tasks:
         if not task.get("description"):
             continue
 
-        matches = re.findall(path_pattern, task["description"])
+        matches = _ABSOLUTE_PATH_RE.findall(task["description"])
         external_paths: list[str] = []
 
         for match in matches:
             try:
-                path = Path(match).resolve()
-                if not _is_path_within(path, workspace_prefix):
+                if not _is_path_within(Path(match), workspace_prefix):
                     external_paths.append(match)
             except (ValueError, OSError, RuntimeError):
                 # Invalid path, skip
@@ -212,12 +260,12 @@ def _check_description_paths(
 
 
 def _check_entity_identifiers(
-    entities: list[dict[str, Any]],
+    entities: Iterable[dict[str, Any]],
     workspace_path: str,
     report: dict[str, Any],
 ) -> None:
     """Check if entity identifiers (especially file type) point outside workspace."""
-    workspace_prefix = Path(workspace_path).resolve()
+    workspace_prefix = Path(_resolve(workspace_path))
 
     for entity in entities:
         # Only check file entities and entities with path-like identifiers
@@ -231,10 +279,8 @@ def _check_entity_identifiers(
             continue
 
         try:
-            id_path = Path(identifier).resolve()
-
             # Check if path is outside workspace
-            if not _is_path_within(id_path, workspace_prefix):
+            if not _is_path_within(Path(identifier), workspace_prefix):
                 report["issues"]["entity_identifier_mismatches"].append({
                     "entity_id": entity["id"],
                     "entity_type": entity["entity_type"],
@@ -269,7 +315,7 @@ def _check_git_consistency(
         git_info["git_repo_detected"] = True
         git_info["git_root"] = workspace_git_root
         git_info["is_workspace_git_root"] = (
-            Path(workspace_git_root).resolve() == Path(workspace_path).resolve()
+            _resolve(workspace_git_root) == _resolve(workspace_path)
         )
 
         # Get remote URL
@@ -292,12 +338,9 @@ def _check_git_consistency(
 
     # Collect paths from tasks
     for task in tasks:
-        if task.get("file_references"):
-            try:
-                file_refs = json.loads(task["file_references"])
-                all_paths.extend([(task, ref) for ref in file_refs])
-            except json.JSONDecodeError:
-                pass
+        file_refs = _task_file_refs(task)
+        if file_refs:
+            all_paths.extend([(task, ref) for ref in file_refs])
 
     # Check each path's git root
     seen_mismatches: set[tuple[int, str]] = set()
@@ -308,7 +351,7 @@ def _check_git_consistency(
         if (
             path_git_root
             and workspace_git_root
-            and Path(path_git_root).resolve() != Path(workspace_git_root).resolve()
+            and _resolve(path_git_root) != _resolve(workspace_git_root)
         ):
             key = (task["id"], path_git_root)
             if key not in seen_mismatches:
@@ -325,17 +368,67 @@ def _check_git_consistency(
     return git_info
 
 
+@functools.lru_cache(maxsize=4096)
+def _cached_resolve(path: str) -> str:
+    """Resolve an absolute path to its canonical form, memoizing the realpath walk.
+
+    Only called with absolute input (see _resolve()), so entries never
+    depend on the cwd. perform_workspace_audit() clears the cache when it
+    finishes, so symlinks changed between audits are always seen.
+    """
+    return os.path.realpath(path)
+
+
+def _absolute(path: str) -> str:
+    """Anchor a relative path at the current cwd, leaving ".." for realpath."""
+    return path if os.path.isabs(path) else os.path.join(os.getcwd(), path)
+
+
+def _resolve(path: str) -> str:
+    """Resolve a path through the per-audit cache, keyed by its absolute form."""
+    return _cached_resolve(_absolute(path))
+
+
+@functools.lru_cache(maxsize=256)
+def _dir_prefix(path: str) -> str:
+    """Return the canonical form of an absolute directory with one trailing separator.
+
+    Parents are almost always the workspace root, so each check's per-item
+    containment tests reuse one prefix string instead of rebuilding it.
+    Cleared together with _cached_resolve() after each audit.
+    """
+    return _cached_resolve(path).rstrip(os.sep) + os.sep
+
+
 def _is_path_within(child: Path, parent: Path) -> bool:
     """Check if child path is within parent path."""
-    try:
-        child.resolve().relative_to(parent.resolve())
-        return True
-    except ValueError:
-        return False
+    # Both sides are canonical strings, so a prefix test ending at a
+    # separator matches Path.relative_to without building Path objects
+    child_str = _resolve(str(child))
+    prefix = _dir_prefix(_absolute(str(parent)))
+    return child_str.startswith(prefix) or child_str + os.sep == prefix
+
+
+def _has_git_ancestor(path: str) -> bool:
+    """Check whether path or any of its parents contains a .git entry."""
+    # Resolve symlinks so a link into a repo subdirectory sees the repo root
+    current = os.path.realpath(path)
+    while True:
+        # .git is a directory in a checkout, a file in worktrees/submodules
+        if os.path.exists(os.path.join(current, ".git")):
+            return True
+        parent = os.path.dirname(current)
+        if parent == current:
+            return False
+        current = parent
 
 
 def _find_git_root(path: str) -> str | None:
     """Find git repository root for given path."""
+    # A few stat calls rule out non-repos without forking git
+    if not _has_git_ancestor(path):
+        return None
+
     try:
         result = subprocess.run(
             ["git", "rev-parse", "--show-toplevel"],
@@ -355,21 +448,18 @@ def _find_git_root(path: str) -> str | None:
 
 def _calculate_statistics(report: dict[str, Any]) -> None:
     """Calculate statistics from audit findings."""
-    contaminated_task_ids: set[int] = set()
-    contaminated_entity_ids: set[int] = set()
-    severity_counts: dict[str, int] = {"high": 0, "medium": 0, "low": 0}
-
-    # Count unique contaminated tasks
-    for _issue_type, issues in report["issues"].items():
-        for issue in issues:
-            if "task_id" in issue:
-                contaminated_task_ids.add(issue["task_id"])
-            if "entity_id" in issue:
-                contaminated_entity_ids.add(issue["entity_id"])
-
-            # Count severities
-            severity = issue.get("severity", "low")
-            severity_counts[severity] += 1
+    all_issues = [issue for issues in report["issues"].values() for issue in issues]
+
+    # Count unique contaminated tasks and entities
+    contaminated_task_ids: set[int] = {
+        issue["task_id"] for issue in all_issues if "task_id" in issue
+    }
+    contaminated_entity_ids: set[int] = {
+        issue["entity_id"] for issue in all_issues if "entity_id" in issue
+    }
+
+    # Count severities
+    severity_counts = Counter(issue.get("severity", "low") for issue in all_issues)
 
     report["statistics"]["contaminated_tasks"] = len(contaminated_task_ids)
     report["statistics"]["contaminated_entities"] = len(contaminated_entity_ids)
@@ -1,8 +1,12 @@
 """Type stubs for workspace integrity audit functions."""
 
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
+_TASK_AUDIT_COLUMNS: str
+_ENTITY_AUDIT_COLUMNS: str
+
 def perform_workspace_audit(
     workspace_path: str,
     include_deleted: bool = False,
@@ -10,25 +14,29 @@ def perform_workspace_audit(
 ) -> dict[str, Any]: ...
 
 def _check_file_references(
-    tasks: list[dict[str, Any]],
+    tasks: Iterable[dict[str, Any]],
     workspace_path: str,
     report: dict[str, Any],
 ) -> None: ...
 
+def _load_file_refs(raw: str | None) -> list[str] | None: ...
+
+def _task_file_refs(task: dict[str, Any]) -> list[str] | None: ...
+
 def _check_suspicious_tags(
-    tasks: list[dict[str, Any]],
+    tasks: Iterable[dict[str, Any]],
     workspace_path: str,
     report: dict[str, Any],
 ) -> None: ...
 
 def _check_description_paths(
-    tasks: list[dict[str, Any]],
+    tasks: Iterable[dict[str, Any]],
     workspace_path: str,
     report: dict[str, Any],
 ) -> None: ...
 
 def _check_entity_identifiers(
-    entities: list[dict[str, Any]],
+    entities: Iterable[dict[str, Any]],
     workspace_path: str,
     report: dict[str, Any],
 ) -> None: ...
@@ -40,8 +48,18 @@ def _check_git_consistency(
     report: dict[str, Any],
 ) -> dict[str, Any]: ...
 
+def _cached_resolve(path: str) -> str: ...
+
+def _absolute(path: str) -> str: ...
+
+def _resolve(path: str) -> str: ...
+
+def _dir_prefix(path: str) -> str: ...
+
 def _is_path_within(child: Path, parent: Path) -> bool: ...
 
+def _has_git_ancestor(path: str) -> bool: ...
+
 def _find_git_root(path: str) -> str | None: ...
 
 def _calculate_statistics(report: dict[str, Any]) -> None: ...
@@ -302,6 +302,48 @@ def get_total_count(
     return result["count"] if result else 0
 
 
+def build_task_filters(
+    status: str | None = None,
+    priority: str | None = None,
+    parent_task_id: int | None = None,
+    tags: str | None = None,
+) -> tuple[str, list[str | int]]:
+    """
+    Build the WHERE conditions shared by task listing queries.
+
+    Args:
+        status: Filter by status
+        priority: Filter by priority
+        parent_task_id: Filter by parent task ID
+        tags: Filter by tags (partial match)
+
+    Returns:
+        Tuple of (" AND ..." clause to append after "WHERE deleted_at IS NULL",
+        parameter bindings)
+    """
+    clause = ""
+    params: list[str | int] = []
+
+    if status:
+        clause += " AND status = ?"
+        params.append(status)
+
+    if priority:
+        clause += " AND priority = ?"
+        params.append(priority)
+
+    if parent_task_id is not None:
+        clause += " AND parent_task_id = ?"
+        params.append(parent_task_id)
+
+    if tags:
+        # Partial match on tags
+        clause += " AND tags LIKE ?"
+        params.append(f"%{tags}%")
+
+    return clause, params
+
+
 @contextmanager
 def connection_context(
     workspace_path: str | None = None,
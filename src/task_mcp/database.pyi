@@ -56,6 +56,27 @@ def init_schema(conn: sqlite3.Connection) -> None:
     """
     ...
 
+def build_task_filters(
+    status: str | None = None,
+    priority: str | None = None,
+    parent_task_id: int | None = None,
+    tags: str | None = None,
+) -> tuple[str, list[str | int]]:
+    """
+    Build the WHERE conditions shared by task listing queries.
+
+    Args:
+        status: Filter by status
+        priority: Filter by priority
+        parent_task_id: Filter by parent task ID
+        tags: Filter by tags (partial match)
+
+    Returns:
+        Tuple of (" AND ..." clause to append after "WHERE deleted_at IS NULL",
+        parameter bindings)
+    """
+    ...
+
 def connection_context(
     workspace_path: str | None = None,
 ) -> AbstractContextManager[sqlite3.Connection]:
@@ -10,6 +10,7 @@ This module defines all data models with comprehensive validation rules:
 """
 
 import json
+import os
 from datetime import datetime
 from typing import Annotated, Any, Optional
 
@@ -18,6 +19,8 @@ from pydantic import (
     BeforeValidator,
     ConfigDict,
     Field,
+    TypeAdapter,
+    ValidationError,
     field_validator,
     model_validator,
 )
@@ -28,6 +31,22 @@ VALID_STATUSES = ("todo", "in_progress", "blocked", "done", "cancelled", "to_be_
 VALID_PRIORITIES = ("low", "medium", "high")
 VALID_ENTITY_TYPES = ("file", "other")
 
+# (old_status, new_status) pairs allowed by validate_status_transition, besides
+# staying in the same status. done, cancelled and to_be_deleted are terminal.
+_ALLOWED_STATUS_TRANSITIONS = frozenset(
+    (old, new)
+    for old, targets in {
+        "todo": ("in_progress", "blocked", "cancelled", "to_be_deleted"),
+        "in_progress": ("blocked", "done", "cancelled", "to_be_deleted"),
+        "blocked": ("in_progress", "cancelled", "to_be_deleted"),
+    }.items()
+    for new in targets
+)
+
+# Built once: parse stored JSON arrays straight from the string
+_INT_LIST_ADAPTER = TypeAdapter(list[int])
+_STR_LIST_ADAPTER = TypeAdapter(list[str])
+
 
 # Helper Functions
 
@@ -49,6 +68,16 @@ def normalize_tags(tags: str) -> str:
     """
     if not tags:
         return ""
+    # Already normalized: lowercase, single inner spaces, no edge spaces.
+    # isprintable() is False for every whitespace character except " "
+    if (
+        tags.islower()
+        and tags.isprintable()
+        and "  " not in tags
+        and tags[0] != " "
+        and tags[-1] != " "
+    ):
+        return tags
     # Split on whitespace, filter empty strings, lowercase, rejoin with single space
     return " ".join(filter(None, tags.lower().split()))
 
@@ -80,22 +109,11 @@ def validate_status_transition(old_status: str, new_status: str) -> bool:
         >>> validate_status_transition("todo", "to_be_deleted")
         True
     """
-    # Terminal states cannot transition
-    if old_status in ("done", "cancelled", "to_be_deleted"):
-        return old_status == new_status  # Only allow same status
-
-    # Allow staying in same status
-    if old_status == new_status:
-        return True
-
-    # Define valid transitions
-    valid_transitions = {
-        "todo": {"in_progress", "blocked", "cancelled", "to_be_deleted"},
-        "in_progress": {"blocked", "done", "cancelled", "to_be_deleted"},
-        "blocked": {"in_progress", "cancelled", "to_be_deleted"},
-    }
-
-    return new_status in valid_transitions.get(old_status, set())
+    # Staying in the same status is always allowed (terminal states included)
+    return (
+        old_status == new_status
+        or (old_status, new_status) in _ALLOWED_STATUS_TRANSITIONS
+    )
 
 
 def validate_json_list_of_ints(v: Any) -> Optional[str]:
@@ -371,9 +389,8 @@ class Task(BaseModel):
         if not self.depends_on:
             return []
         try:
-            result: list[int] = json.loads(self.depends_on)
-            return result
-        except json.JSONDecodeError:
+            return _INT_LIST_ADAPTER.validate_json(self.depends_on)
+        except ValidationError:
             return []
 
     def get_file_references_list(self) -> list[str]:
@@ -386,9 +403,8 @@ class Task(BaseModel):
         if not self.file_references:
             return []
         try:
-            result: list[str] = json.loads(self.file_references)
-            return result
-        except json.JSONDecodeError:
+            return _STR_LIST_ADAPTER.validate_json(self.file_references)
+        except ValidationError:
             return []
 
 
@@ -548,7 +564,7 @@ class ProjectInfo(BaseModel):
     @classmethod
     def validate_workspace_path(cls, v: str) -> str:
         """Validate workspace path is absolute."""
-        if not v.startswith('/'):
+        if not os.path.isabs(v):
             raise ValueError("workspace_path must be an absolute path")
         return v
 
@@ -94,7 +94,12 @@ def list_tasks(
             "items": list[dict]
         }
     """
-    from .database import get_connection, get_total_count, validate_pagination_params
+    from .database import (
+        build_task_filters,
+        get_connection,
+        get_total_count,
+        validate_pagination_params,
+    )
     from .errors import InvalidModeError
     from .master import register_project
     from .utils import resolve_workspace
@@ -119,25 +124,8 @@ def list_tasks(
 
     try:
         # Build query with filters
-        query = "SELECT * FROM tasks WHERE deleted_at IS NULL"
-        params: list[str | int] = []
-
-        if status:
-            query += " AND status = ?"
-            params.append(status)
-
-        if priority:
-            query += " AND priority = ?"
-            params.append(priority)
-
-        if parent_task_id is not None:
-            query += " AND parent_task_id = ?"
-            params.append(parent_task_id)
-
-        if tags:
-            # Partial match on tags
-            query += " AND tags LIKE ?"
-            params.append(f"%{tags}%")
+        filters, params = build_task_filters(status, priority, parent_task_id, tags)
+        query = "SELECT * FROM tasks WHERE deleted_at IS NULL" + filters
 
         # Get total count before pagination
         total_count = get_total_count(cursor, query, params)
@@ -182,6 +170,99 @@ def list_tasks(
         conn.close()
 
 
+@track_usage
+@mcp.tool()
+def get_task_stats(
+    workspace_path: str,
+    status: str | None = None,
+    priority: str | None = None,
+    parent_task_id: int | None = None,
+    tags: str | None = None,
+) -> dict[str, Any]:
+    """
+    Aggregate counts and dependency edges over all tasks matching the filters.
+
+    Reads only id, status, priority, tags and depends_on, so the result stays
+    small however many tasks match; pair it with a paginated list_tasks call.
+
+    Args:
+        workspace_path: REQUIRED workspace path
+        status: Filter by status
+        priority: Filter by priority
+        parent_task_id: Filter by parent task ID
+        tags: Filter by tags (space-separated, partial match)
+
+    Returns:
+        Dict with counts and blocker edges:
+        {
+            "total_count": int,
+            "status_counts": dict[str, int],
+            "priority_counts": dict[str, int],
+            "tag_counts": dict[str, int],
+            "blockers": [{"id": int, "blocks_task_ids": list[int]}]
+        }
+    """
+    import json
+    from collections import Counter
+
+    from .database import build_task_filters, get_connection
+    from .master import register_project
+    from .utils import resolve_workspace
+
+    # Auto-register project and update last_accessed
+    workspace = resolve_workspace(workspace_path)
+    register_project(workspace)
+
+    conn = get_connection(workspace_path)
+    cursor = conn.cursor()
+
+    try:
+        filters, params = build_task_filters(status, priority, parent_task_id, tags)
+        cursor.execute(
+            "SELECT id, status, priority, tags, depends_on FROM tasks "
+            "WHERE deleted_at IS NULL" + filters + " ORDER BY created_at DESC",
+            params,
+        )
+
+        status_counts: Counter[str] = Counter()
+        priority_counts: Counter[str] = Counter()
+        tag_counts: Counter[str] = Counter()
+        blocks: dict[int, list[int]] = {}  # dependency id -> dependent task ids
+        total_count = 0
+
+        for row in cursor:
+            total_count += 1
+            status_counts[row["status"]] += 1
+            priority_counts[row["priority"]] += 1
+            if row["tags"]:
+                tag_counts.update(row["tags"].split())
+
+            # depends_on is a JSON array; skip empty or malformed values
+            if not row["depends_on"]:
+                continue
+            try:
+                dep_list = json.loads(row["depends_on"])
+            except json.JSONDecodeError:
+                continue
+            if not isinstance(dep_list, list):
+                continue
+            for dep_id in dep_list:
+                blocks.setdefault(dep_id, []).append(row["id"])
+
+        return {
+            "total_count": total_count,
+            "status_counts": dict(status_counts),
+            "priority_counts": dict(priority_counts),
+            "tag_counts": dict(tag_counts),
+            "blockers": [
+                {"id": dep_id, "blocks_task_ids": task_ids}
+                for dep_id, task_ids in blocks.items()
+            ],
+        }
+    finally:
+        conn.close()
+
+
 @track_usage
 @mcp.tool()
 def create_task(
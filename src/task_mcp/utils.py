@@ -1,6 +1,8 @@
 """Utility functions for workspace detection, path hashing, and validation."""
 
+import functools
 import hashlib
+import os
 import subprocess
 from pathlib import Path
 
@@ -33,12 +35,15 @@ def resolve_workspace(workspace_path: str | None = None) -> str:
     return ensure_absolute_path(workspace_path)
 
 
+@functools.lru_cache(maxsize=256)
 def hash_workspace_path(workspace_path: str) -> str:
     """
     Hash workspace path to create safe database filename.
 
     Uses SHA256 hash, truncated to 8 characters for brevity
     while maintaining sufficient uniqueness for typical usage.
+    Results are cached per process, since every tool call hashes its
+    (already resolved) workspace path again.
 
     Args:
         workspace_path: Path to workspace directory
@@ -46,7 +51,10 @@ def hash_workspace_path(workspace_path: str) -> str:
     Returns:
         8-character lowercase hexadecimal hash string (e.g., "a1b2c3d4")
     """
-    return hashlib.sha256(workspace_path.encode()).hexdigest()[:8]
+    # Not a security use: lets FIPS-mode OpenSSL builds skip their checks
+    return hashlib.sha256(
+        workspace_path.encode(), usedforsecurity=False
+    ).hexdigest()[:8]
 
 
 def get_project_db_path(workspace_path: str | None = None) -> Path:
@@ -64,6 +72,26 @@ def get_project_db_path(workspace_path: str | None = None) -> Path:
     Returns:
         Path to project-specific database file
     """
+    db_path, _project_hash = get_project_db_info(workspace_path)
+    return db_path
+
+
+def get_project_db_info(workspace_path: str | None = None) -> tuple[Path, str]:
+    """
+    Generate project-specific database path together with its project hash.
+
+    Lets callers that also need the project ID avoid resolving and hashing
+    the workspace a second time. The hash is taken over the resolved path,
+    so it always matches the database filename.
+
+    Creates ~/.task-mcp/databases/ directory if it doesn't exist.
+
+    Args:
+        workspace_path: Optional workspace path (passed to resolve_workspace)
+
+    Returns:
+        Tuple of (database path, 8-character project hash)
+    """
     resolved_workspace = resolve_workspace(workspace_path)
     project_hash = hash_workspace_path(resolved_workspace)
 
@@ -71,7 +99,7 @@ def get_project_db_path(workspace_path: str | None = None) -> Path:
     databases_dir = Path.home() / ".task-mcp" / "databases"
     databases_dir.mkdir(parents=True, exist_ok=True)
 
-    return databases_dir / f"project_{project_hash}.db"
+    return databases_dir / f"project_{project_hash}.db", project_hash
 
 
 def get_master_db_path() -> Path:
@@ -121,6 +149,12 @@ def ensure_absolute_path(path: str) -> str:
     if not path or not path.strip():
         raise ValueError("Path cannot be empty")
 
+    # Absolute paths go straight to realpath: a canonical path comes back
+    # unchanged without building Path objects, and symlinks are re-read on
+    # every call so a re-pointed workspace selects its new database
+    if os.path.isabs(path):
+        return os.path.realpath(path)
+
     return str(Path(path).resolve())
 
 
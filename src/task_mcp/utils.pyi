@@ -5,6 +5,7 @@ from pathlib import Path
 def resolve_workspace(workspace_path: str | None = None) -> str: ...
 def hash_workspace_path(workspace_path: str) -> str: ...
 def get_project_db_path(workspace_path: str | None = None) -> Path: ...
+def get_project_db_info(workspace_path: str | None = None) -> tuple[Path, str]: ...
 def get_master_db_path() -> Path: ...
 def validate_description_length(description: str | None) -> None: ...
 def ensure_absolute_path(path: str) -> str: ...
@@ -0,0 +1,18 @@
+"""
+Gunicorn configuration for running Task Viewer API in production.
+
+Usage (from the task-viewer directory):
+    gunicorn main:app -c gunicorn.conf.py
+
+Each worker is a separate process with its own event loop (uvloop and
+httptools via uvicorn[standard]), MCP client and caches. `python main.py`
+remains the single-process auto-reload development server.
+"""
+
+import multiprocessing
+import os
+
+bind = f"{os.getenv('HOST', '127.0.0.1')}:{os.getenv('PORT', '8001')}"
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+worker_class = "uvicorn.workers.UvicornWorker"
+loglevel = os.getenv("LOG_LEVEL", "info").lower()
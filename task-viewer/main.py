@@ -9,17 +9,19 @@ This is Phase 1: Read-only viewer (no create/update/delete operations).
 
 from __future__ import annotations
 
-import json
+import hmac
 import logging
 import os
+from collections import Counter
 from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import Any, Optional
 
+import orjson
 from dotenv import load_dotenv
-from fastapi import FastAPI, Header, HTTPException, Query
+from fastapi import APIRouter, Depends, FastAPI, Header, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, Response
 from fastapi.staticfiles import StaticFiles
 
 # Load environment variables
@@ -41,7 +43,9 @@ from models import (
     TaskListResponse,
     TaskResponse,
     TaskSearchResponse,
+    TaskTreeResponse,
 )
+from response_cache import response_cache
 from workspace_resolver import workspace_resolver
 
 # Configure logging
@@ -50,12 +54,25 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Cache lifetime (seconds) for project info; the project list is pre-rendered
+# by the workspace resolver instead
+PROJECT_INFO_CACHE_TTL = 30
+
+# Last successful project info body (JSON) per project_id, served if task-mcp fails
+_last_good_project_info: dict[str, str] = {}
+
 
 # API Key Authentication
-async def verify_api_key(x_api_key: Optional[str] = Header(None)) -> str:
+# Resolved once at import; changing API_KEY requires a restart
+_EXPECTED_API_KEY = os.getenv("API_KEY", "dev-key-local-only").encode()
+
+
+def verify_api_key(x_api_key: Optional[str] = Header(None)) -> str:
     """
     Verify API key from X-API-Key header.
 
+    Uses a constant-time comparison against the key loaded at startup.
+
     Args:
         x_api_key: API key from request header
 
@@ -65,15 +82,13 @@ async def verify_api_key(x_api_key: Optional[str] = Header(None)) -> str:
     Raises:
         HTTPException: 401 if key is missing or invalid
     """
-    expected_key = os.getenv("API_KEY", "dev-key-local-only")
-
     if not x_api_key:
         raise HTTPException(
             status_code=401,
             detail="Missing API key. Include X-API-Key header.",
         )
 
-    if x_api_key != expected_key:
+    if not hmac.compare_digest(x_api_key.encode(), _EXPECTED_API_KEY):
         raise HTTPException(status_code=401, detail="Invalid API key")
 
     return x_api_key
@@ -117,6 +132,24 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Authenticated API routes; /health and the frontend stay on the app itself
+api_router = APIRouter(prefix="/api", dependencies=[Depends(verify_api_key)])
+
+# List endpoints return the MCP dicts as-is (response_model=None) rather than
+# re-validating every task; their schemas are still documented via responses=.
+# They serialize the dict with _json_response() themselves, since FastAPI would
+# otherwise walk every item through jsonable_encoder before serializing.
+
+
+def _json_response(payload: dict[str, Any], status_code: int = 200) -> Response:
+    """Serialize a response body with orjson, skipping FastAPI's encoder pass."""
+    return Response(
+        content=orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
 # Configure CORS
 origins = [
     "http://localhost:8001",  # Same origin
@@ -148,13 +181,13 @@ async def value_error_handler(request, exc: ValueError):
     else:
         status_code = 400
 
-    return JSONResponse(
-        status_code=status_code,
-        content={
+    return _json_response(
+        {
             "error": "Bad Request" if status_code == 400 else "Not Found",
             "message": error_msg,
             "status_code": status_code,
         },
+        status_code=status_code,
     )
 
 
@@ -162,19 +195,19 @@ async def value_error_handler(request, exc: ValueError):
 async def runtime_error_handler(request, exc: RuntimeError):
     """Handle RuntimeError (MCP connection failures)."""
     logger.error(f"Runtime error: {exc}", exc_info=True)
-    return JSONResponse(
-        status_code=500,
-        content={
+    return _json_response(
+        {
             "error": "Internal Server Error",
             "message": str(exc),
             "status_code": 500,
         },
+        status_code=500,
     )
 
 
 # Health Check Endpoint (No Authentication)
 @app.get("/health", response_model=HealthCheckResponse)
-async def health_check():
+def health_check():
     """
     Health check endpoint with MCP connection status.
 
@@ -204,24 +237,25 @@ async def health_check():
 
 
 # Project Endpoints
-@app.get("/api/projects", response_model=ProjectListResponse, dependencies=[])
-async def list_projects(x_api_key: str = Header(None)):
+@api_router.get(
+    "/projects",
+    response_model=None,
+    responses={200: {"model": ProjectListResponse}},
+)
+async def list_projects():
     """
     List all projects from master database.
 
     Requires API key authentication via X-API-Key header.
     """
-    # Verify API key
-    await verify_api_key(x_api_key)
-
-    projects = workspace_resolver.list_projects()
-    return ProjectListResponse(
-        projects=[ProjectResponse(**p) for p in projects], total=len(projects)
+    # Project set only changes when the resolver reloads; serve its bytes as-is
+    return Response(
+        content=workspace_resolver.get_projects_json(), media_type="application/json"
     )
 
 
-@app.get("/api/projects/{project_id}/info", response_model=ProjectInfoResponse)
-async def get_project_info(project_id: str, x_api_key: str = Header(None)):
+@api_router.get("/projects/{project_id}/info", response_model=ProjectInfoResponse)
+async def get_project_info(project_id: str):
     """
     Get detailed project information including task statistics.
 
@@ -230,8 +264,10 @@ async def get_project_info(project_id: str, x_api_key: str = Header(None)):
 
     Requires API key authentication.
     """
-    # Verify API key
-    await verify_api_key(x_api_key)
+    cache_key = f"project_info:{project_id}"
+    cached = response_cache.get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
 
     # Get project data
     project_data = workspace_resolver.get_project_by_id(project_id)
@@ -254,12 +290,22 @@ async def get_project_info(project_id: str, x_api_key: str = Header(None)):
             by_priority=stats_result.get("by_priority", {}),
         )
 
-        return ProjectInfoResponse(
+        response = ProjectInfoResponse(
             project=ProjectResponse(**project_data), stats=stats
         )
+        # Serialize once; cache hits and the fallback reuse the same body
+        body = response.model_dump_json()
+        response_cache.set(cache_key, body, PROJECT_INFO_CACHE_TTL)
+        _last_good_project_info[project_id] = body
+        return Response(content=body, media_type="application/json")
 
     except Exception as e:
         logger.error(f"Failed to get project stats: {e}", exc_info=True)
+        # Prefer stale stats over zeros while task-mcp is unavailable
+        last_good = _last_good_project_info.get(project_id)
+        if last_good is not None:
+            return Response(content=last_good, media_type="application/json")
+
         # Return project without stats on error
         return ProjectInfoResponse(
             project=ProjectResponse(**project_data),
@@ -269,14 +315,60 @@ async def get_project_info(project_id: str, x_api_key: str = Header(None)):
         )
 
 
+def _unwrap_page(result: dict[str, Any]) -> tuple[list[dict[str, Any]], int]:
+    """
+    Extract items and total count from a paginated task-mcp response.
+
+    Args:
+        result: task-mcp response with "items" and "total_count" keys
+
+    Returns:
+        Tuple of (items, total_count)
+
+    Raises:
+        ValueError: If task-mcp returned an error payload
+    """
+    error = result.get("error")
+    if error:
+        message = error.get("message") if isinstance(error, dict) else error
+        raise ValueError(message or "task-mcp request failed")
+    return result["items"], result["total_count"]
+
+
+async def _get_task_stats(args: dict[str, Any]) -> dict[str, Any]:
+    """
+    Fetch filtered counts and blocker edges from task-mcp's get_task_stats.
+
+    An error payload degrades to empty stats instead of failing the request,
+    since the stats only decorate the task page.
+
+    Args:
+        args: get_task_stats arguments (workspace_path plus list filters)
+
+    Returns:
+        Stats dict with status_counts, priority_counts, tag_counts, blockers
+    """
+    stats = await mcp_service.call_tool("get_task_stats", args)
+    error = stats.get("error")
+    if error:
+        logger.warning(f"get_task_stats failed, serving empty stats: {error}")
+        return {"status_counts": {}, "priority_counts": {}, "tag_counts": {}, "blockers": []}
+    return stats
+
+
 # Task Endpoints
-# IMPORTANT: Specific routes (search, next, blocked) must come BEFORE /{task_id}
-# to avoid path matching issues
+# {task_id:int} only matches digits, so the static routes (search, next,
+# blocked) can never be shadowed regardless of declaration order
+tasks_router = APIRouter(prefix="/tasks")
+
 
-@app.get("/api/tasks/search", response_model=TaskSearchResponse)
+@tasks_router.get(
+    "/search",
+    response_model=None,
+    responses={200: {"model": TaskSearchResponse}},
+)
 async def search_tasks(
     q: str,
-    x_api_key: str = Header(None),
     project_id: Optional[str] = None,
     workspace_path: Optional[str] = None,
     limit: int = Query(20, ge=1, le=100),
@@ -291,34 +383,39 @@ async def search_tasks(
 
     Requires API key authentication.
     """
-    # Verify API key
-    await verify_api_key(x_api_key)
-
     if not q:
         raise ValueError("Search query 'q' is required")
 
     # Resolve workspace path
     resolved_workspace = workspace_resolver.resolve(project_id, workspace_path)
 
-    # Call task-mcp
-    tasks_data = await mcp_service.call_tool(
-        "search_tasks", {"search_term": q, "workspace_path": resolved_workspace}
+    # Call task-mcp (limit applied in SQL)
+    tasks_data, total = _unwrap_page(
+        await mcp_service.call_tool(
+            "search_tasks",
+            {
+                "search_term": q,
+                "workspace_path": resolved_workspace,
+                "limit": limit,
+                "mode": "details",
+            },
+        )
     )
 
-    # Apply limit
-    limited_tasks = tasks_data[:limit]
-
-    return TaskSearchResponse(
-        tasks=[TaskResponse(**t) for t in limited_tasks],
-        total=len(tasks_data),
-        query=q,
-        limit=limit,
-    )
+    return _json_response({
+        "tasks": tasks_data,
+        "total": total,
+        "query": q,
+        "limit": limit,
+    })
 
 
-@app.get("/api/tasks/next", response_model=TaskListResponse)
+@tasks_router.get(
+    "/next",
+    response_model=None,
+    responses={200: {"model": TaskListResponse}},
+)
 async def get_next_tasks(
-    x_api_key: str = Header(None),
     project_id: Optional[str] = None,
     workspace_path: Optional[str] = None,
     limit: int = Query(10, ge=1, le=50),
@@ -332,9 +429,6 @@ async def get_next_tasks(
 
     Requires API key authentication.
     """
-    # Verify API key
-    await verify_api_key(x_api_key)
-
     # Resolve workspace path
     resolved_workspace = workspace_resolver.resolve(project_id, workspace_path)
 
@@ -346,17 +440,20 @@ async def get_next_tasks(
     # Apply limit
     limited_tasks = tasks_data[:limit]
 
-    return TaskListResponse(
-        tasks=[TaskResponse(**t) for t in limited_tasks],
-        total=len(tasks_data),
-        limit=limit,
-        offset=0,
-    )
+    return _json_response({
+        "tasks": limited_tasks,
+        "total": len(tasks_data),
+        "limit": limit,
+        "offset": 0,
+    })
 
 
-@app.get("/api/tasks/blocked", response_model=TaskListResponse)
+@tasks_router.get(
+    "/blocked",
+    response_model=None,
+    responses={200: {"model": TaskListResponse}},
+)
 async def get_blocked_tasks(
-    x_api_key: str = Header(None),
     project_id: Optional[str] = None,
     workspace_path: Optional[str] = None,
 ):
@@ -368,9 +465,6 @@ async def get_blocked_tasks(
 
     Requires API key authentication.
     """
-    # Verify API key
-    await verify_api_key(x_api_key)
-
     # Resolve workspace path
     resolved_workspace = workspace_resolver.resolve(project_id, workspace_path)
 
@@ -379,17 +473,16 @@ async def get_blocked_tasks(
         "get_blocked_tasks", {"workspace_path": resolved_workspace}
     )
 
-    return TaskListResponse(
-        tasks=[TaskResponse(**t) for t in tasks_data],
-        total=len(tasks_data),
-        limit=len(tasks_data),
-        offset=0,
-    )
+    return _json_response({
+        "tasks": tasks_data,
+        "total": len(tasks_data),
+        "limit": len(tasks_data),
+        "offset": 0,
+    })
 
 
-@app.get("/api/tags")
+@api_router.get("/tags")
 async def get_tags(
-    x_api_key: str = Header(None),
     project_id: Optional[str] = None,
     workspace_path: Optional[str] = None,
 ):
@@ -405,28 +498,12 @@ async def get_tags(
 
     Requires API key authentication.
     """
-    # Verify API key
-    await verify_api_key(x_api_key)
-
     # Resolve workspace path
     resolved_workspace = workspace_resolver.resolve(project_id, workspace_path)
 
-    # Call task-mcp to get all tasks
-    tasks_data = await mcp_service.call_tool(
-        "list_tasks", {"workspace_path": resolved_workspace}
-    )
-
-    # Extract and count tags
-    tag_counts: dict[str, int] = {}
-    for task in tasks_data:
-        tags_str = task.get("tags")
-        if tags_str:
-            # Tags are space-separated
-            tags = tags_str.strip().split()
-            for tag in tags:
-                tag = tag.strip()
-                if tag:
-                    tag_counts[tag] = tag_counts.get(tag, 0) + 1
+    # Tag counts are aggregated in task-mcp over every task
+    stats = await _get_task_stats({"workspace_path": resolved_workspace})
+    tag_counts: dict[str, int] = stats["tag_counts"]
 
     # Convert to list of tag objects sorted by count (descending)
     tag_list = [{"tag": tag, "count": count} for tag, count in tag_counts.items()]
@@ -438,9 +515,12 @@ async def get_tags(
     }
 
 
-@app.get("/api/tasks", response_model=TaskListResponse)
+@tasks_router.get(
+    "",
+    response_model=None,
+    responses={200: {"model": TaskListResponse}},
+)
 async def list_tasks(
-    x_api_key: str = Header(None),
     project_id: Optional[str] = None,
     workspace_path: Optional[str] = None,
     status: Optional[str] = None,
@@ -464,11 +544,10 @@ async def list_tasks(
         - limit: Max results per page (default: 50, max: 100)
         - offset: Pagination offset (default: 0)
 
+    Blocker flags and meta counts are computed over all matching tasks.
+
     Requires API key authentication.
     """
-    # Verify API key
-    await verify_api_key(x_api_key)
-
     # Resolve workspace path
     resolved_workspace = workspace_resolver.resolve(project_id, workspace_path)
 
@@ -487,46 +566,25 @@ async def list_tasks(
     elif tags:
         args["tags"] = tags
 
-    # Call task-mcp
-    tasks_data = await mcp_service.call_tool("list_tasks", args)
+    # Let task-mcp apply pagination in SQL
+    tasks_data, total = _unwrap_page(
+        await mcp_service.call_tool(
+            "list_tasks", {**args, "limit": limit, "offset": offset, "mode": "details"}
+        )
+    )
 
-    # Add blocker detection logic
-    # Build a map of which tasks are blocked by which tasks
-    blocker_map = {}  # task_id -> [list of task_ids it blocks]
+    # Blocker flags and meta counts cover every matching task, not just this
+    # page; task-mcp aggregates them from narrow columns
+    stats = await _get_task_stats(args)
+    blocker_map = {
+        blocker["id"]: blocker["blocks_task_ids"] for blocker in stats["blockers"]
+    }
 
+    # Attach blocker metadata to the returned page
     for task in tasks_data:
-        task_id = task.get("id")
-        depends_on = task.get("depends_on")
-
-        # Parse depends_on (could be JSON string or list)
-        if depends_on:
-            try:
-                if isinstance(depends_on, str):
-                    dep_list = json.loads(depends_on)
-                else:
-                    dep_list = depends_on
-
-                # For each dependency, mark it as a blocker
-                for dep_id in dep_list:
-                    if dep_id not in blocker_map:
-                        blocker_map[dep_id] = []
-                    blocker_map[dep_id].append(task_id)
-            except (json.JSONDecodeError, TypeError):
-                pass
-
-    # Enhance tasks with blocker metadata
-    for task in tasks_data:
-        task_id = task.get("id")
-        if task_id in blocker_map:
-            task["is_blocker"] = True
-            task["blocks_task_ids"] = blocker_map[task_id]
-        else:
-            task["is_blocker"] = False
-            task["blocks_task_ids"] = []
-
-    # Apply pagination
-    total = len(tasks_data)
-    paginated_tasks = tasks_data[offset : offset + limit]
+        blocked_ids = blocker_map.get(task.get("id"))
+        task["is_blocker"] = bool(blocked_ids)
+        task["blocks_task_ids"] = blocked_ids or []
 
     # Build filter info
     filters = {}
@@ -537,36 +595,23 @@ async def list_tasks(
 
     # Build meta counts
     meta = {
-        "status_counts": {},
-        "priority_counts": {},
+        "status_counts": stats["status_counts"],
+        "priority_counts": stats["priority_counts"],
     }
 
-    # Count by status
-    for task in tasks_data:
-        task_status = task.get("status", "unknown")
-        meta["status_counts"][task_status] = (
-            meta["status_counts"].get(task_status, 0) + 1
-        )
-
-        task_priority = task.get("priority", "unknown")
-        meta["priority_counts"][task_priority] = (
-            meta["priority_counts"].get(task_priority, 0) + 1
-        )
-
-    return TaskListResponse(
-        tasks=[TaskResponse(**t) for t in paginated_tasks],
-        total=total,
-        limit=limit,
-        offset=offset,
-        filters=filters if filters else None,
-        meta=meta,
-    )
+    return _json_response({
+        "tasks": tasks_data,
+        "total": total,
+        "limit": limit,
+        "offset": offset,
+        "filters": filters if filters else None,
+        "meta": meta,
+    })
 
 
-@app.get("/api/tasks/{task_id}/tree", response_model=TaskResponse)
+@tasks_router.get("/{task_id:int}/tree", response_model=TaskTreeResponse)
 async def get_task_tree(
     task_id: int,
-    x_api_key: str = Header(None),
     project_id: Optional[str] = None,
     workspace_path: Optional[str] = None,
 ):
@@ -582,9 +627,6 @@ async def get_task_tree(
 
     Requires API key authentication.
     """
-    # Verify API key
-    await verify_api_key(x_api_key)
-
     # Resolve workspace path
     resolved_workspace = workspace_resolver.resolve(project_id, workspace_path)
 
@@ -596,13 +638,13 @@ async def get_task_tree(
     if not task_tree:
         raise ValueError(f"Task with ID {task_id} not found or deleted")
 
-    return TaskResponse(**task_tree)
+    # Validated once against response_model
+    return task_tree
 
 
-@app.get("/api/tasks/{task_id}", response_model=TaskResponse)
+@tasks_router.get("/{task_id:int}", response_model=TaskResponse)
 async def get_task(
     task_id: int,
-    x_api_key: str = Header(None),
     project_id: Optional[str] = None,
     workspace_path: Optional[str] = None,
 ):
@@ -615,9 +657,6 @@ async def get_task(
 
     Requires API key authentication.
     """
-    # Verify API key
-    await verify_api_key(x_api_key)
-
     # Resolve workspace path
     resolved_workspace = workspace_resolver.resolve(project_id, workspace_path)
 
@@ -629,16 +668,20 @@ async def get_task(
     if not task_data:
         raise ValueError(f"Task with ID {task_id} not found or deleted")
 
-    return TaskResponse(**task_data)
+    # Validated once against response_model
+    return task_data
 
 
 # Entity Endpoints
 # IMPORTANT: Specific routes (search) must come BEFORE /{entity_id}
 # to avoid path matching issues
 
-@app.get("/api/entities", response_model=EntityListResponse)
+@api_router.get(
+    "/entities",
+    response_model=None,
+    responses={200: {"model": EntityListResponse}},
+)
 async def list_entities(
-    x_api_key: str = Header(None),
     project_id: Optional[str] = None,
     workspace_path: Optional[str] = None,
     entity_type: Optional[str] = None,
@@ -661,9 +704,6 @@ async def list_entities(
 
     Requires API key authentication.
     """
-    # Verify API key
-    await verify_api_key(x_api_key)
-
     # Resolve workspace path
     resolved_workspace = workspace_resolver.resolve(project_id, workspace_path)
 
@@ -688,19 +728,22 @@ async def list_entities(
     if tags:
         filters["tags"] = tags
 
-    return EntityListResponse(
-        entities=[EntityResponse(**e) for e in paginated_entities],
-        total=total,
-        limit=limit,
-        offset=offset,
-        filters=filters if filters else None,
-    )
+    return _json_response({
+        "entities": paginated_entities,
+        "total": total,
+        "limit": limit,
+        "offset": offset,
+        "filters": filters if filters else None,
+    })
 
 
-@app.get("/api/entities/search", response_model=EntitySearchResponse)
+@api_router.get(
+    "/entities/search",
+    response_model=None,
+    responses={200: {"model": EntitySearchResponse}},
+)
 async def search_entities(
     q: str,
-    x_api_key: str = Header(None),
     project_id: Optional[str] = None,
     workspace_path: Optional[str] = None,
     entity_type: Optional[str] = None,
@@ -717,9 +760,6 @@ async def search_entities(
 
     Requires API key authentication.
     """
-    # Verify API key
-    await verify_api_key(x_api_key)
-
     if not q:
         raise ValueError("Search query 'q' is required")
 
@@ -740,21 +780,20 @@ async def search_entities(
     # Apply limit
     limited_entities = entities_data[:limit]
 
-    return EntitySearchResponse(
-        entities=[EntityResponse(**e) for e in limited_entities],
-        total=len(entities_data),
-        query=q,
-        limit=limit,
-    )
+    return _json_response({
+        "entities": limited_entities,
+        "total": len(entities_data),
+        "query": q,
+        "limit": limit,
+    })
 
 
 # Entity Detail Endpoints
 # IMPORTANT: Specific routes (stats, search) must come BEFORE /{entity_id}
 # to avoid path matching issues where "stats" would be parsed as entity_id
 
-@app.get("/api/entities/stats", response_model=EntityStatsResponse)
+@api_router.get("/entities/stats", response_model=EntityStatsResponse)
 async def get_entity_stats(
-    x_api_key: str = Header(None),
     project_id: Optional[str] = None,
     workspace_path: Optional[str] = None,
 ):
@@ -772,9 +811,6 @@ async def get_entity_stats(
 
     Requires API key authentication.
     """
-    # Verify API key
-    await verify_api_key(x_api_key)
-
     # Resolve workspace path
     resolved_workspace = workspace_resolver.resolve(project_id, workspace_path)
 
@@ -786,21 +822,14 @@ async def get_entity_stats(
     # Calculate total count
     total = len(entities_data)
 
-    # Calculate counts by type
-    file_count = sum(1 for e in entities_data if e.get("entity_type") == "file")
-    other_count = sum(1 for e in entities_data if e.get("entity_type") == "other")
-
-    # Extract and count tags
-    tag_counts: dict[str, int] = {}
+    # Count types and tags (space-separated) in one pass
+    type_counts: Counter[str] = Counter()
+    tag_counts: Counter[str] = Counter()
     for entity in entities_data:
+        type_counts[entity.get("entity_type")] += 1
         tags_str = entity.get("tags")
         if tags_str:
-            # Tags are space-separated
-            tags = tags_str.strip().split()
-            for tag in tags:
-                tag = tag.strip()
-                if tag:
-                    tag_counts[tag] = tag_counts.get(tag, 0) + 1
+            tag_counts.update(tags_str.split())
 
     # Convert to list of TagCount objects sorted by count (descending), take top 10
     top_tags_list = [
@@ -811,15 +840,18 @@ async def get_entity_stats(
 
     return EntityStatsResponse(
         total=total,
-        by_type=EntityTypeCount(file=file_count, other=other_count),
+        by_type=EntityTypeCount(file=type_counts["file"], other=type_counts["other"]),
         top_tags=top_tags,
     )
 
 
-@app.get("/api/entities/{entity_id}/tasks", response_model=TaskListResponse)
+@api_router.get(
+    "/entities/{entity_id}/tasks",
+    response_model=None,
+    responses={200: {"model": TaskListResponse}},
+)
 async def get_entity_tasks(
     entity_id: int,
-    x_api_key: str = Header(None),
     project_id: Optional[str] = None,
     workspace_path: Optional[str] = None,
     status: Optional[str] = None,
@@ -839,9 +871,6 @@ async def get_entity_tasks(
 
     Requires API key authentication.
     """
-    # Verify API key
-    await verify_api_key(x_api_key)
-
     # Resolve workspace path
     resolved_workspace = workspace_resolver.resolve(project_id, workspace_path)
 
@@ -865,19 +894,18 @@ async def get_entity_tasks(
     if priority:
         filters["priority"] = priority
 
-    return TaskListResponse(
-        tasks=[TaskResponse(**t) for t in tasks_data],
-        total=len(tasks_data),
-        limit=len(tasks_data),
-        offset=0,
-        filters=filters if filters else None,
-    )
+    return _json_response({
+        "tasks": tasks_data,
+        "total": len(tasks_data),
+        "limit": len(tasks_data),
+        "offset": 0,
+        "filters": filters if filters else None,
+    })
 
 
-@app.get("/api/entities/{entity_id}", response_model=EntityResponse)
+@api_router.get("/entities/{entity_id}", response_model=EntityResponse)
 async def get_entity(
     entity_id: int,
-    x_api_key: str = Header(None),
     project_id: Optional[str] = None,
     workspace_path: Optional[str] = None,
 ):
@@ -893,9 +921,6 @@ async def get_entity(
 
     Requires API key authentication.
     """
-    # Verify API key
-    await verify_api_key(x_api_key)
-
     # Resolve workspace path
     resolved_workspace = workspace_resolver.resolve(project_id, workspace_path)
 
@@ -907,8 +932,12 @@ async def get_entity(
     if not entity_data:
         raise ValueError(f"Entity with ID {entity_id} not found or deleted")
 
-    return EntityResponse(**entity_data)
+    # Validated once against response_model
+    return entity_data
+
 
+api_router.include_router(tasks_router)
+app.include_router(api_router)
 
 # Mount static files for frontend
 app.mount("/static", StaticFiles(directory="static"), name="static")
@@ -920,7 +949,7 @@ async def serve_frontend():
     return FileResponse("static/index.html")
 
 
-# Run the application
+# Run the application (development server; see gunicorn.conf.py for production)
 if __name__ == "__main__":
     import uvicorn
 
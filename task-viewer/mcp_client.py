@@ -8,6 +8,8 @@ instance directly for maximum performance.
 
 from __future__ import annotations
 
+import asyncio
+import inspect
 import logging
 import sys
 from pathlib import Path
@@ -29,6 +31,8 @@ class MCPClientService:
         self._mcp: Optional[Any] = None
         self._initialized: bool = False
         self._task_mcp_path: Optional[Path] = None
+        self._tool_cache: dict[str, tuple[Any, bool]] = {}  # name -> (tool, is_async)
+        self._tool_names_str: str = ""  # For not-found errors
 
     async def initialize(self) -> None:
         """
@@ -41,6 +45,12 @@ class MCPClientService:
             logger.warning("MCP client service already initialized")
             return
 
+        # Reuse the module and tools kept from a previous initialize()
+        if self._mcp is not None:
+            self._initialized = True
+            logger.info("MCP client service re-initialized from cached module")
+            return
+
         try:
             logger.info("Initializing MCP client service...")
 
@@ -61,6 +71,7 @@ class MCPClientService:
             from task_mcp.server import mcp
 
             self._mcp = mcp
+            await self._load_tools()
             self._initialized = True
             logger.info("MCP client service initialized successfully")
 
@@ -71,21 +82,32 @@ class MCPClientService:
             logger.error(f"Failed to initialize MCP client: {e}", exc_info=True)
             raise RuntimeError(f"MCP initialization failed: {str(e)}") from e
 
-    async def close(self) -> None:
-        """Close MCP client connection (cleanup on shutdown)."""
-        if self._initialized:
-            try:
-                logger.info("Closing MCP client service...")
-                self._initialized = False
-                self._mcp = None
+    async def _load_tools(self) -> None:
+        """
+        Resolve every registered tool once so call_tool is a dict lookup.
 
-                # Remove task-mcp from Python path
-                if self._task_mcp_path and str(self._task_mcp_path) in sys.path:
-                    sys.path.remove(str(self._task_mcp_path))
+        The tool set is fixed when task-mcp is imported, so FastMCP's async
+        get_tool does not need to run per request.
+        """
+        tools = await self._mcp.get_tools()  # name -> tool mapping
+        self._tool_cache = {
+            name: (tool, inspect.iscoroutinefunction(tool.fn))
+            for name, tool in tools.items()
+        }
+        self._tool_names_str = ", ".join(sorted(self._tool_cache))
+        logger.debug(f"Loaded {len(self._tool_cache)} task-mcp tools")
 
-                logger.info("MCP client service closed")
-            except Exception as e:
-                logger.error(f"Error closing MCP client: {e}", exc_info=True)
+    async def close(self) -> None:
+        """
+        Close MCP client connection (cleanup on shutdown).
+
+        The imported task-mcp module and resolved tools are kept so a later
+        initialize() does not pay the import cost again.
+        """
+        if self._initialized:
+            logger.info("Closing MCP client service...")
+            self._initialized = False
+            logger.info("MCP client service closed")
 
     async def call_tool(
         self, tool_name: str, arguments: Optional[dict[str, Any]] = None
@@ -115,29 +137,31 @@ class MCPClientService:
             # Strip "mcp__task-mcp__" prefix if present (Claude Desktop format)
             clean_tool_name = tool_name.replace("mcp__task-mcp__", "")
 
-            # Get tool using FastMCP's get_tool method (it's async)
-            try:
-                tool = await self._mcp.get_tool(clean_tool_name)
-            except KeyError:
-                # Tool not found - list available tools
-                available_tools = [t.name for t in await self._mcp.get_tools()]
+            # Tools are pre-resolved at initialize()
+            entry = self._tool_cache.get(clean_tool_name)
+            if entry is None:
                 raise AttributeError(
-                    f"Tool '{clean_tool_name}' not found. Available tools: {available_tools}"
+                    f"Tool '{clean_tool_name}' not found. "
+                    f"Available tools: {self._tool_names_str}"
                 )
+            tool, is_async = entry
 
             # Call the tool function directly
             args = arguments or {}
-            logger.debug(f"Calling tool '{clean_tool_name}' with args: {args}")
-
-            # Call the function (may be sync or async)
-            import inspect
+            # Lazy %-formatting: hot path, args can be large
+            logger.debug("Calling tool '%s' with args: %r", clean_tool_name, args)
 
-            if inspect.iscoroutinefunction(tool.fn):
+            # Call the function (may be sync or async). Sync tools do blocking
+            # SQLite I/O, so run them in a worker thread; this keeps the event
+            # loop free and lets independent calls overlap under asyncio.gather
+            if is_async:
                 result = await tool.fn(**args)
             else:
-                result = tool.fn(**args)
+                result = await asyncio.to_thread(tool.fn, **args)
 
-            logger.debug(f"Tool '{clean_tool_name}' returned {type(result)}")
+            logger.debug(
+                "Tool '%s' returned %s", clean_tool_name, type(result).__name__
+            )
             return result
 
         except AttributeError as e:
@@ -159,7 +183,7 @@ class MCPClientService:
 
         try:
             tools = []
-            for tool in await self._mcp.get_tools():
+            for tool, _is_async in self._tool_cache.values():
                 tools.append({"name": tool.name, "description": tool.description or ""})
             return tools
         except Exception as e:
@@ -10,11 +10,16 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class TaskResponse(BaseModel):
-    """Response model for a single task."""
+    """Response model for a single task.
+
+    Validates single-task responses. List endpoints return task-mcp dicts
+    as-is and only use this model (via TaskListResponse) for their OpenAPI
+    schema, so no instance is built per row.
+    """
 
     id: int
     title: str
@@ -27,14 +32,27 @@ class TaskResponse(BaseModel):
     blocker_reason: Optional[str] = None
     file_references: Optional[str] = None  # JSON array as string
     created_by: str
-    created_at: datetime
-    updated_at: datetime
-    completed_at: Optional[datetime] = None
-    deleted_at: Optional[datetime] = None
-    subtasks: Optional[list[TaskResponse]] = None  # For tree endpoint
+    # Timestamps pass through as task-mcp's ISO 8601 strings (as in
+    # EntityResponse), matching the list endpoints without a parse/reformat
+    created_at: str
+    updated_at: str
+    completed_at: Optional[str] = None
+    deleted_at: Optional[str] = None
+
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="ignore")
+
+
+class TaskTreeResponse(TaskResponse):
+    """Response model for a task with its nested subtasks (tree endpoint).
+
+    Kept separate from TaskResponse so flat task schemas are not recursive.
+    """
+
+    subtasks: Optional[list[TaskTreeResponse]] = None
+
 
-    class Config:
-        from_attributes = True
+# Resolve the self-referencing subtasks annotation at import, not first use
+TaskTreeResponse.model_rebuild()
 
 
 class TaskListResponse(BaseModel):
@@ -66,8 +84,7 @@ class ProjectResponse(BaseModel):
     created_at: datetime
     last_accessed: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="ignore")
 
 
 class ProjectListResponse(BaseModel):
@@ -132,8 +149,7 @@ class EntityResponse(BaseModel):
     updated_at: str = Field(..., description="ISO 8601 timestamp")
     deleted_at: Optional[str] = Field(None, description="Soft delete timestamp")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="ignore")
 
 
 class EntityListResponse(BaseModel):
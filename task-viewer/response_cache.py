@@ -0,0 +1,69 @@
+"""
+Response Cache for Task Viewer API.
+
+Short-lived in-process cache for endpoints whose payload is not
+user-specific (project listings and project statistics). Entries expire
+after a fixed TTL so task counts stay reasonably fresh without paying an
+MCP round-trip on every request.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """
+    Time-based cache of fully built API responses.
+
+    Values are stored alongside a monotonic expiry timestamp and evicted
+    lazily on lookup.
+    """
+
+    def __init__(self) -> None:
+        """Initialize response cache with no entries."""
+        self._entries: dict[str, tuple[float, Any]] = {}  # key -> (expires_at, value)
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a cached response if it has not expired.
+
+        Args:
+            key: Cache key (e.g., "project_info:1e7be4ae")
+
+        Returns:
+            Cached value, or None on miss or expiry
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+
+        return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """
+        Store a response for ttl seconds.
+
+        Args:
+            key: Cache key
+            value: Response to cache
+            ttl: Time-to-live in seconds
+        """
+        self._entries[key] = (time.monotonic() + ttl, value)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._entries.clear()
+
+
+# Singleton instance
+response_cache = ResponseCache()
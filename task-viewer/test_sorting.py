@@ -1,17 +1,65 @@
 #!/usr/bin/env python3
 """
 Playwright test to diagnose Related Tasks table sorting issue.
+
+playwright is imported inside the functions that drive the browser, so
+importing this module (e.g. during pytest collection) does not load it.
 """
 
 import asyncio
+import os
 from datetime import datetime
 from pathlib import Path
 
-from playwright.async_api import async_playwright
+# Injected before page scripts: returns Alpine.js sort state and the Related
+# Tasks row IDs together so each diagnostic phase is one page.evaluate call
+SNAPSHOT_SCRIPT = """
+window.__snap = () => {
+    const el = document.querySelector('[x-data]');
+    const data = el && el.__x && el.__x.$data;
+    const rows = Array.from(document.querySelectorAll('table tbody tr'));
+    return {
+        alpine: data ? {
+            relatedTasksSortColumn: data.relatedTasksSortColumn,
+            relatedTasksSortDirection: data.relatedTasksSortDirection,
+            detailPageRelatedTasks: data.detailPageRelatedTasks,
+            sortRelatedTasksExists: typeof data.sortRelatedTasks === 'function'
+        } : null,
+        ids: rows.map(row => {
+            const idCell = row.querySelector('td:nth-child(2)');
+            return idCell ? idCell.textContent.trim() : null;
+        }).filter(id => id !== null)
+    };
+};
+"""
+
+
+async def wait_for_sort_column(page, column: str, timeout: int = 2000) -> None:
+    """Wait until Alpine.js reports the given related-tasks sort column.
+
+    Times out quietly so the diagnostics below can report the stale state.
+    """
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+    try:
+        await page.wait_for_function(
+            """
+            (column) => {
+                const el = document.querySelector('[x-data]');
+                return !!(el && el.__x && el.__x.$data
+                    && el.__x.$data.relatedTasksSortColumn === column);
+            }
+            """,
+            arg=column,
+            timeout=timeout,
+        )
+    except PlaywrightTimeoutError:
+        print(f"   ⚠ Sort column did not become '{column}' within {timeout}ms")
 
 
 async def test_sorting():
     """Test the Related Tasks table sorting functionality."""
+    from playwright.async_api import async_playwright
 
     # Configuration
     BASE_URL = "http://127.0.0.1:8001"
@@ -23,8 +71,9 @@ async def test_sorting():
 
     async with async_playwright() as p:
         # Launch browser
-        browser = await p.chromium.launch(headless=False, slow_mo=500)
+        browser = await p.chromium.launch(headless=False)
         context = await browser.new_context(viewport={"width": 1920, "height": 1080})
+        await context.add_init_script(SNAPSHOT_SCRIPT)
         page = await context.new_page()
 
         # Enable console logging
@@ -56,7 +105,7 @@ async def test_sorting():
             print("   Setting API key...")
             await api_input.fill(API_KEY)
             await page.click('button:has-text("Save")')
-            await page.wait_for_timeout(2000)
+            await api_input.wait_for(state="hidden")
         print("   ✓ Ready to proceed")
 
         # Step 3: Find and open a task with the "Full Details" button
@@ -71,7 +120,7 @@ async def test_sorting():
         first_button = full_details_buttons.first
         print("   Clicking 'Full Details' on first task...")
         await first_button.click()
-        await page.wait_for_timeout(2000)
+        await page.wait_for_load_state("networkidle")
 
         # Check for Related Tasks table on detail page
         related_header = page.locator('h2:has-text("Related Tasks")')
@@ -89,21 +138,10 @@ async def test_sorting():
         # Step 4: Capture initial state
         print("\n[4] Capturing initial Related Tasks table state...")
 
-        # Get Alpine.js data
-        alpine_data = await page.evaluate("""
-            () => {
-                const el = document.querySelector('[x-data]');
-                if (el && el.__x && el.__x.$data) {
-                    return {
-                        relatedTasksSortColumn: el.__x.$data.relatedTasksSortColumn,
-                        relatedTasksSortDirection: el.__x.$data.relatedTasksSortDirection,
-                        detailPageRelatedTasks: el.__x.$data.detailPageRelatedTasks,
-                        sortRelatedTasksExists: typeof el.__x.$data.sortRelatedTasks === 'function'
-                    };
-                }
-                return null;
-            }
-        """)
+        # Get Alpine.js data and initial task order in one round-trip
+        snap = await page.evaluate("__snap()")
+        alpine_data = snap["alpine"]
+        initial_task_ids = snap["ids"]
 
         print("   Alpine.js State:")
         if alpine_data:
@@ -122,16 +160,6 @@ async def test_sorting():
         else:
             print("     ✗ Could not access Alpine.js data")
 
-        # Get initial task order
-        initial_task_ids = await page.evaluate("""
-            () => {
-                const rows = Array.from(document.querySelectorAll('table tbody tr'));
-                return rows.map(row => {
-                    const idCell = row.querySelector('td:nth-child(2)');
-                    return idCell ? idCell.textContent.trim() : null;
-                }).filter(id => id !== null);
-            }
-        """)
         print(f"   Initial task IDs order: {initial_task_ids}")
 
         await page.screenshot(path=SCREENSHOTS_DIR / f"{timestamp}_03_initial_state.png")
@@ -162,22 +190,12 @@ async def test_sorting():
 
         print("   Clicking ID header...")
         await id_header_button.click()
-        await page.wait_for_timeout(500)
+        await wait_for_sort_column(page, "id")
 
-        # Capture state after click
-        after_click_data = await page.evaluate("""
-            () => {
-                const el = document.querySelector('[x-data]');
-                if (el && el.__x && el.__x.$data) {
-                    return {
-                        relatedTasksSortColumn: el.__x.$data.relatedTasksSortColumn,
-                        relatedTasksSortDirection: el.__x.$data.relatedTasksSortDirection,
-                        detailPageRelatedTasks: el.__x.$data.detailPageRelatedTasks
-                    };
-                }
-                return null;
-            }
-        """)
+        # Capture state and task order after click
+        snap = await page.evaluate("__snap()")
+        after_click_data = snap["alpine"]
+        after_sort_ids = snap["ids"]
 
         print("   After clicking ID header:")
         if after_click_data:
@@ -186,16 +204,6 @@ async def test_sorting():
         else:
             print("     ✗ Could not access Alpine.js data after click")
 
-        # Get task order after sort
-        after_sort_ids = await page.evaluate("""
-            () => {
-                const rows = Array.from(document.querySelectorAll('table tbody tr'));
-                return rows.map(row => {
-                    const idCell = row.querySelector('td:nth-child(2)');
-                    return idCell ? idCell.textContent.trim() : null;
-                }).filter(id => id !== null);
-            }
-        """)
         print(f"   Task IDs after sort: {after_sort_ids}")
         print(f"   Order changed: {initial_task_ids != after_sort_ids}")
 
@@ -208,21 +216,10 @@ async def test_sorting():
         title_header_button = page.locator('th button:has-text("Title")')
         print("   Clicking Title header...")
         await title_header_button.click()
-        await page.wait_for_timeout(500)
+        await wait_for_sort_column(page, "title")
 
         # Capture state
-        after_title_click = await page.evaluate("""
-            () => {
-                const el = document.querySelector('[x-data]');
-                if (el && el.__x && el.__x.$data) {
-                    return {
-                        relatedTasksSortColumn: el.__x.$data.relatedTasksSortColumn,
-                        relatedTasksSortDirection: el.__x.$data.relatedTasksSortDirection
-                    };
-                }
-                return null;
-            }
-        """)
+        after_title_click = (await page.evaluate("__snap()"))["alpine"]
 
         print("   After clicking Title header:")
         if after_title_click:
@@ -274,7 +271,8 @@ async def test_sorting():
         if 'error' in manual_sort_result:
             print(f"     - Error: {manual_sort_result['error']}")
 
-        await page.wait_for_timeout(500)
+        # Let Alpine.js re-render before capturing
+        await page.evaluate("() => new Promise(requestAnimationFrame)")
         await page.screenshot(path=SCREENSHOTS_DIR / f"{timestamp}_06_manual_sort.png")
         print("   ✓ Screenshot: 06_manual_sort.png")
 
@@ -305,9 +303,10 @@ async def test_sorting():
         else:
             print("  ✓ No JavaScript errors detected")
 
-        # Keep browser open for inspection
-        print("\n[Browser will remain open for 30 seconds for manual inspection]")
-        await page.wait_for_timeout(30000)
+        # Keep browser open for inspection only when asked to
+        if os.getenv("DEBUG_KEEP_OPEN"):
+            print("\n[Browser will remain open for 30 seconds for manual inspection]")
+            await page.wait_for_timeout(30000)
 
         await browser.close()
         print("\n✓ Test complete!")
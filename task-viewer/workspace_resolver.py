@@ -7,13 +7,38 @@ Caches project mappings on startup for fast resolution.
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import logging
 import os
-from typing import Optional
+import sys
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Optional
+
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# Resolved once at import; changing DEFAULT_WORKSPACE_PATH requires a restart
+_DEFAULT_WORKSPACE_PATH = os.getenv("DEFAULT_WORKSPACE_PATH")
+
+
+@functools.lru_cache(maxsize=1024)
+def _hash_path(path: str) -> str:
+    """
+    Return the 8-character SHA-256 prefix for a normalized workspace path.
+
+    SHA-256 (not a faster hash) keeps IDs identical to task-mcp's project IDs.
+
+    Args:
+        path: Normalized workspace path
+
+    Returns:
+        8-character hash ID
+    """
+    return hashlib.sha256(path.encode()).hexdigest()[:8]
+
 
 class WorkspaceResolver:
     """
@@ -26,7 +51,11 @@ class WorkspaceResolver:
 
     def __init__(self) -> None:
         """Initialize workspace resolver with empty cache."""
-        self._project_cache: dict[str, dict[str, str]] = {}  # hash_id -> project data
+        # hash_id -> project data; a read-only view once loaded, only
+        # initialize() replaces it
+        self._project_cache: Mapping[str, dict[str, Any]] = MappingProxyType({})
+        self._available_projects_str: str = "none"  # For unknown project_id errors
+        self._projects_blob: Optional[bytes] = None  # Pre-rendered list_projects body
         self._initialized: bool = False
 
     async def initialize(self, mcp_service: Any) -> None:
@@ -50,14 +79,16 @@ class WorkspaceResolver:
             projects = await mcp_service.call_tool("mcp__task-mcp__list_projects", {})
 
             # Build cache: use hash of workspace_path as project_id
+            project_cache: dict[str, dict[str, Any]] = {}
             for project in projects:
                 workspace_path = project.get("workspace_path", "")
                 if workspace_path:
-                    # Generate hash ID from workspace path
-                    hash_id = self._generate_hash_id(workspace_path)
+                    # Generate hash ID from workspace path (interned: it is
+                    # the key every resolve() lookup compares against)
+                    hash_id = sys.intern(self._generate_hash_id(workspace_path))
 
                     # Store project data with hash ID as key
-                    self._project_cache[hash_id] = {
+                    project_cache[hash_id] = {
                         "id": hash_id,
                         "workspace_path": workspace_path,
                         "friendly_name": project.get("friendly_name"),
@@ -65,6 +96,16 @@ class WorkspaceResolver:
                         "last_accessed": project.get("last_accessed"),
                     }
 
+            # Fixed after startup: freeze so nothing mutates the cache in place
+            self._project_cache = MappingProxyType(project_cache)
+            self._projects_blob = None  # Project set changed; re-render on demand
+            self._available_projects_str = (
+                ", ".join(
+                    f"{pid} ({project['friendly_name'] or 'Unnamed'})"
+                    for pid, project in self._project_cache.items()
+                )
+                or "none"
+            )
             self._initialized = True
             logger.info(f"Loaded {len(self._project_cache)} projects into cache")
             logger.debug(f"Project IDs: {list(self._project_cache.keys())}")
@@ -86,14 +127,8 @@ class WorkspaceResolver:
         Returns:
             8-character hash ID (e.g., "1e7be4ae")
         """
-        # Normalize path (remove trailing slash)
-        normalized_path = workspace_path.rstrip("/")
-
-        # Generate SHA-256 hash
-        hash_digest = hashlib.sha256(normalized_path.encode()).hexdigest()
-
-        # Return first 8 characters
-        return hash_digest[:8]
+        # Normalize path (remove trailing slash), then hash (memoized)
+        return _hash_path(workspace_path.rstrip("/"))
 
     def resolve(
         self, project_id: Optional[str] = None, workspace_path: Optional[str] = None
@@ -125,21 +160,19 @@ class WorkspaceResolver:
 
         # Priority 2: Project ID lookup
         if project_id:
-            if project_id in self._project_cache:
-                return self._project_cache[project_id]["workspace_path"]
-
-            # Provide helpful error message
-            available_projects = [
-                f"{pid} ({self._project_cache[pid].get('friendly_name', 'Unnamed')})"
-                for pid in self._project_cache.keys()
-            ]
+            project = self._project_cache.get(project_id)
+            if project is not None:
+                cached_path: str = project["workspace_path"]
+                return cached_path
+
+            # Provide helpful error message (list built once at initialize)
             raise ValueError(
                 f"Project '{project_id}' not found. "
-                f"Available projects: {', '.join(available_projects) if available_projects else 'none'}"
+                f"Available projects: {self._available_projects_str}"
             )
 
         # Priority 3: Default workspace
-        default = os.getenv("DEFAULT_WORKSPACE_PATH")
+        default = _DEFAULT_WORKSPACE_PATH
         if default and os.path.isdir(default):
             logger.debug(f"Using default workspace: {default}")
             return default
@@ -170,6 +203,23 @@ class WorkspaceResolver:
         """
         return list(self._project_cache.values())
 
+    def get_projects_json(self) -> bytes:
+        """
+        Get the project list response body as pre-rendered JSON.
+
+        Rendered once per project cache load, so the list endpoint can serve
+        it without re-validating or re-serializing every project.
+
+        Returns:
+            JSON bytes of {"projects": [...], "total": N}
+        """
+        if self._projects_blob is None:
+            projects = self.list_projects()
+            self._projects_blob = orjson.dumps(
+                {"projects": projects, "total": len(projects)}
+            )
+        return self._projects_blob
+
     def get_project_count(self) -> int:
         """Get number of cached projects."""
         return len(self._project_cache)
@@ -8,9 +8,13 @@ import sys
 
 sys.path.insert(0, 'src')
 
+import contextlib
 import json
+from collections.abc import Iterator
 from datetime import datetime
 
+from pydantic import TypeAdapter
+
 from task_mcp.models import (
     VALID_PRIORITIES,
     VALID_STATUSES,
@@ -22,6 +26,21 @@ from task_mcp.models import (
     validate_status_transition,
 )
 
+# Validates a whole batch of tasks in one call
+_TASK_LIST_ADAPTER = TypeAdapter(list[Task])
+
+
+@contextlib.contextmanager
+def expect_value_error(message: str) -> Iterator[None]:
+    """Exit with a failure unless the block raises ValueError containing message."""
+    try:
+        yield
+    except ValueError as e:
+        assert message in str(e).lower()
+    else:
+        print(f"  ✗ Should have raised ValueError ({message})")
+        sys.exit(1)
+
 
 def test_normalize_tags():
     """Test tag normalization."""
@@ -80,35 +99,28 @@ def test_description_length_validation():
     assert len(task.description) == 10000
 
     # Invalid description (too long)
-    try:
-        task = Task(title="Test", description="x" * 10001)
-        print("  ✗ Should have raised ValueError for description > 10000 chars")
-        sys.exit(1)
-    except ValueError as e:
-        assert "cannot exceed 10000 characters" in str(e).lower()
-        print("  ✓ Description length validation works")
+    with expect_value_error("cannot exceed 10000 characters"):
+        Task(title="Test", description="x" * 10001)
+    print("  ✓ Description length validation works")
 
 
 def test_status_validation():
     """Test status enum validation."""
     print("\nTesting status validation...")
 
-    # Valid statuses (skip 'blocked' since it requires blocker_reason)
-    for status in VALID_STATUSES:
-        if status == 'blocked':
-            task = Task(title="Test", status=status, blocker_reason="Test blocker")
-        else:
-            task = Task(title="Test", status=status)
-        assert task.status == status
+    # Valid statuses ('blocked' also requires blocker_reason)
+    inputs = [
+        {"title": "Test", "status": status,
+         **({"blocker_reason": "Test blocker"} if status == 'blocked' else {})}
+        for status in VALID_STATUSES
+    ]
+    tasks = _TASK_LIST_ADAPTER.validate_python(inputs)
+    assert [task.status for task in tasks] == list(VALID_STATUSES)
 
     # Invalid status
-    try:
-        task = Task(title="Test", status="invalid_status")
-        print("  ✗ Should have raised ValueError for invalid status")
-        sys.exit(1)
-    except ValueError as e:
-        assert "status must be one of" in str(e).lower()
-        print("  ✓ Status validation works")
+    with expect_value_error("status must be one of"):
+        Task(title="Test", status="invalid_status")
+    print("  ✓ Status validation works")
 
 
 def test_priority_validation():
@@ -116,18 +128,15 @@ def test_priority_validation():
     print("\nTesting priority validation...")
 
     # Valid priorities
-    for priority in VALID_PRIORITIES:
-        task = Task(title="Test", priority=priority)
-        assert task.priority == priority
+    tasks = _TASK_LIST_ADAPTER.validate_python(
+        [{"title": "Test", "priority": priority} for priority in VALID_PRIORITIES]
+    )
+    assert [task.priority for task in tasks] == list(VALID_PRIORITIES)
 
     # Invalid priority
-    try:
-        task = Task(title="Test", priority="urgent")
-        print("  ✗ Should have raised ValueError for invalid priority")
-        sys.exit(1)
-    except ValueError as e:
-        assert "priority must be one of" in str(e).lower()
-        print("  ✓ Priority validation works")
+    with expect_value_error("priority must be one of"):
+        Task(title="Test", priority="urgent")
+    print("  ✓ Priority validation works")
 
 
 def test_blocker_reason_validation():
@@ -135,12 +144,8 @@ def test_blocker_reason_validation():
     print("\nTesting blocker_reason validation...")
 
     # Blocked status without blocker_reason should fail
-    try:
-        task = Task(title="Test", status="blocked")
-        print("  ✗ Should have raised ValueError for blocked without blocker_reason")
-        sys.exit(1)
-    except ValueError as e:
-        assert "blocker_reason is required" in str(e).lower()
+    with expect_value_error("blocker_reason is required"):
+        Task(title="Test", status="blocked")
 
     # Blocked status with blocker_reason should succeed
     task = Task(title="Test", status="blocked", blocker_reason="Waiting for API")
@@ -163,20 +168,12 @@ def test_depends_on_validation():
     assert json.loads(task.depends_on) == [4, 5, 6]
 
     # Invalid JSON
-    try:
-        task = Task(title="Test", depends_on='not json')
-        print("  ✗ Should have raised ValueError for invalid JSON")
-        sys.exit(1)
-    except ValueError as e:
-        assert "must be valid json" in str(e).lower()
+    with expect_value_error("must be valid json"):
+        Task(title="Test", depends_on='not json')
 
     # Invalid type in array
-    try:
-        task = Task(title="Test", depends_on='["string"]')
-        print("  ✗ Should have raised ValueError for non-integer in depends_on")
-        sys.exit(1)
-    except ValueError as e:
-        assert "must contain only integers" in str(e).lower()
+    with expect_value_error("must contain only integers"):
+        Task(title="Test", depends_on='["string"]')
 
     print("  ✓ depends_on validation works")
 
@@ -195,12 +192,8 @@ def test_file_references_validation():
     assert json.loads(task.file_references) == ["test.py", "main.py"]
 
     # Invalid type in array
-    try:
-        task = Task(title="Test", file_references='[123]')
-        print("  ✗ Should have raised ValueError for non-string in file_references")
-        sys.exit(1)
-    except ValueError as e:
-        assert "must contain only strings" in str(e).lower()
+    with expect_value_error("must contain only strings"):
+        Task(title="Test", file_references='[123]')
 
     print("  ✓ file_references validation works")
 
@@ -251,12 +244,8 @@ def test_task_update_model():
     assert task_update.title is None  # Optional field
 
     # Update to blocked must include blocker_reason
-    try:
-        task_update = TaskUpdate(status="blocked")
-        print("  ✗ Should have raised ValueError for blocked without blocker_reason")
-        sys.exit(1)
-    except ValueError as e:
-        assert "blocker_reason is required" in str(e).lower()
+    with expect_value_error("blocker_reason is required"):
+        TaskUpdate(status="blocked")
 
     print("  ✓ TaskUpdate model works")
 
@@ -276,17 +265,13 @@ def test_project_info_model():
     assert project.workspace_path == "/home/user/project"
 
     # Test workspace path validation (must be absolute)
-    try:
-        project = ProjectInfo(
+    with expect_value_error("must be an absolute path"):
+        ProjectInfo(
             id="abc12345",
             workspace_path="relative/path",
             created_at=datetime.utcnow(),
             last_accessed=datetime.utcnow()
         )
-        print("  ✗ Should have raised ValueError for relative path")
-        sys.exit(1)
-    except ValueError as e:
-        assert "must be an absolute path" in str(e).lower()
 
     print("  ✓ ProjectInfo model works")
 
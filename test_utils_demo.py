@@ -9,6 +9,8 @@ This script demonstrates:
 4. Validation utilities
 """
 
+import contextlib
+import io
 import os
 import sys
 from pathlib import Path
@@ -19,7 +21,7 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 from task_mcp.utils import (
     ensure_absolute_path,
     get_master_db_path,
-    get_project_db_path,
+    get_project_db_info,
     hash_workspace_path,
     resolve_workspace,
     validate_description_length,
@@ -37,12 +39,10 @@ def demo_workspace_resolution() -> None:
     """Demonstrate workspace resolution priority order."""
     print_section("1. Workspace Resolution Priority Order")
 
-    # Save original environment
-    original_env = os.environ.get("TASK_MCP_WORKSPACE")
+    # Save and clear original environment
+    original_env = os.environ.pop("TASK_MCP_WORKSPACE", None)
 
     # Test Priority 3: Current working directory (fallback)
-    if "TASK_MCP_WORKSPACE" in os.environ:
-        del os.environ["TASK_MCP_WORKSPACE"]
     workspace = resolve_workspace()
     print("\nPriority 3 (CWD fallback):")
     print("  Input: None (no param, no env var)")
@@ -75,8 +75,8 @@ def demo_workspace_resolution() -> None:
     # Restore original environment
     if original_env:
         os.environ["TASK_MCP_WORKSPACE"] = original_env
-    elif "TASK_MCP_WORKSPACE" in os.environ:
-        del os.environ["TASK_MCP_WORKSPACE"]
+    else:
+        os.environ.pop("TASK_MCP_WORKSPACE", None)
 
 
 def demo_path_hashing() -> None:
@@ -136,8 +136,7 @@ def demo_database_paths() -> None:
     ]
 
     for workspace in test_workspaces:
-        db_path = get_project_db_path(workspace)
-        path_hash = hash_workspace_path(workspace)
+        db_path, path_hash = get_project_db_info(workspace)
         print(f"\n  Workspace: {workspace}")
         print(f"  Hash: {path_hash}")
         print(f"  Database: {db_path}")
@@ -249,5 +248,19 @@ Pathlib: All path operations use Path objects for cross-platform support
 """)
 
 
+def run_buffered() -> None:
+    """Run main() with output collected in memory and written out once.
+
+    Output produced before an error is still written.
+    """
+    buffer = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buffer):
+            main()
+    finally:
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
+
+
 if __name__ == "__main__":
-    main()
+    run_buffered()
@@ -0,0 +1,25 @@
+"""Shared pytest configuration for the task-mcp test suite."""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+
+import pytest
+
+# RAM-backed temp root on Linux: test SQLite databases never touch the disk
+_SHM_ROOT = "/dev/shm"
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Root tmp_path under /dev/shm unless a temp location was chosen explicitly.
+
+    Only the parent of pytest's numbered pytest-of-<user>/pytest-N directories
+    moves, so concurrent runs and old-run cleanup behave as before. An explicit
+    --basetemp or TMPDIR always wins.
+    """
+    if config.option.basetemp or os.environ.get("TMPDIR"):
+        return
+    if sys.platform == "linux" and os.access(_SHM_ROOT, os.W_OK | os.X_OK):
+        tempfile.tempdir = _SHM_ROOT
@@ -7,8 +7,9 @@ Tests validate all 5 contamination detection types and full audit workflow.
 from __future__ import annotations
 
 import json
+import sqlite3
 import subprocess
-from collections.abc import Generator
+from collections.abc import Callable, Generator, Iterator
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, patch
@@ -18,18 +19,146 @@ import pytest
 # NOTE: These imports will fail until audit.py is created
 # This is intentional TDD - we define the API through tests first
 from task_mcp.audit import (
+    _cached_resolve,
     _calculate_statistics,
     _check_description_paths,
     _check_entity_identifiers,
     _check_file_references,
     _check_git_consistency,
     _check_suspicious_tags,
+    _dir_prefix,
     _find_git_root,
     _generate_recommendations,
     _is_path_within,
     perform_workspace_audit,
 )
-from task_mcp.database import get_connection
+from task_mcp.database import get_connection, init_schema
+
+# Fixtures seed rows with executemany: one prepared statement per table
+TASK_INSERT_SQL = """
+    INSERT INTO tasks (
+        title, description, file_references, tags, status, created_at, updated_at
+    ) VALUES (?, ?, ?, ?, ?, datetime('now'), datetime('now'))
+"""
+DELETED_TASK_INSERT_SQL = """
+    INSERT INTO tasks (
+        title, description, file_references, tags, status, created_at, updated_at, deleted_at
+    ) VALUES (?, ?, ?, ?, ?, datetime('now'), datetime('now'), datetime('now'))
+"""
+ENTITY_INSERT_SQL = """
+    INSERT INTO entities (
+        entity_type, name, identifier, created_at, updated_at
+    ) VALUES (?, ?, ?, datetime('now'), datetime('now'))
+"""
+
+# Every test in this module runs from the same working directory
+_CWD = Path.cwd()
+
+# Every issue category in an audit report
+ISSUE_KEYS = (
+    "file_reference_mismatches",
+    "suspicious_tags",
+    "description_path_references",
+    "entity_identifier_mismatches",
+    "git_repo_mismatches",
+)
+
+# Top-level sections of an audit report
+REPORT_KEYS = (
+    "workspace_path",
+    "audit_timestamp",
+    "total_tasks",
+    "total_entities",
+    "contamination_found",
+    "issues",
+    "statistics",
+    "recommendations",
+)
+
+# Columns the _check_* helpers read; tests fetch only these
+TASK_COLS = ("id", "title", "description", "file_references", "tags", "status")
+ENTITY_COLS = ("id", "entity_type", "name", "identifier")
+
+
+def _issue_report(*keys: str) -> dict[str, Any]:
+    """Build a report skeleton with an empty issue list per key."""
+    return {"issues": {key: [] for key in keys}}
+
+
+@pytest.fixture(autouse=True)
+def _task_mcp_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Point HOME at the test's tmp_path so databases land under it."""
+    (tmp_path / ".task-mcp").mkdir(exist_ok=True)
+    monkeypatch.setenv("HOME", str(tmp_path))
+
+
+@pytest.fixture(scope="session")
+def shared_audit_db(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Generator[tuple[Path, str, sqlite3.Connection], None, None]:
+    """Create one workspace database and connection for the session.
+
+    Tests reset its rows instead of rebuilding it.
+
+    Yields:
+        Tuple of (HOME directory holding the database, workspace path, connection)
+    """
+    home = tmp_path_factory.mktemp("home")
+    workspace = home / "test-workspace"
+    workspace.mkdir()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("HOME", str(home))
+        conn = _tuned_connection(str(workspace))
+    try:
+        yield home, str(workspace), conn
+    finally:
+        conn.close()
+
+
+@pytest.fixture(scope="class")
+def temp_workspace(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """Create a temporary workspace shared by a test class."""
+    return str(tmp_path_factory.mktemp("test-workspace"))
+
+
+def _tuned_connection(workspace: str) -> sqlite3.Connection:
+    """Open the workspace database tuned for disposable test data.
+
+    get_connection() already sets WAL and the busy timeout. The database is
+    thrown away with the test session, so commits skip fsync entirely.
+    """
+    conn = get_connection(workspace)
+    conn.executescript(
+        "PRAGMA synchronous=OFF; PRAGMA temp_store=MEMORY; PRAGMA cache_size=-64000;"
+    )
+    return conn
+
+
+def _memory_conn() -> sqlite3.Connection:
+    """Open a private in-memory database with the production schema.
+
+    For the _check_* tests, which only read back the rows their fixture
+    wrote and never go through get_connection() themselves.
+    """
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    init_schema(conn)
+    return conn
+
+
+def _fetch_rows(
+    conn: sqlite3.Connection,
+    table: str,
+    cols: tuple[str, ...],
+    where: str = "deleted_at IS NULL",
+    params: tuple[Any, ...] = (),
+) -> Iterator[dict[str, Any]]:
+    """Stream the given columns as plain dicts, the shape the audit checks take.
+
+    Rows are built lazily from the cursor; each check makes a single pass.
+    """
+    cursor = conn.execute(f"SELECT {', '.join(cols)} FROM {table} WHERE {where}", params)
+    return (dict(zip(cols, row)) for row in cursor)
 
 
 class TestPathContainmentHelper:
@@ -64,156 +193,171 @@ class TestPathContainmentHelper:
 
     def test_is_path_within_relative_paths_resolved(self) -> None:
         """Test relative paths are properly resolved before comparison."""
-        parent = Path.cwd()
+        parent = _CWD
         child = Path("./subdir/file.py").resolve()
 
         result = _is_path_within(child, parent)
         assert isinstance(result, bool)  # Should not raise exception
 
+    def test_is_path_within_sibling_prefix(self) -> None:
+        """Test a sibling sharing the parent's name as a prefix is outside."""
+        parent = Path("/home/user/project")
 
-class TestFileReferenceValidation:
-    """Test file reference contamination detection."""
-
-    @pytest.fixture
-    def temp_workspace(self, tmp_path: Path) -> Generator[str, None, None]:
-        """Create temporary workspace for testing."""
-        workspace = str(tmp_path / "test-workspace")
-        Path(workspace).mkdir()
-        yield workspace
-
-    @pytest.fixture
-    def setup_contaminated_db(
-        self, temp_workspace: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-    ) -> Generator[str, None, None]:
-        """Setup test database with contaminated file references."""
-        # Point to temp directory for databases
-        test_home = tmp_path / ".task-mcp"
-        test_home.mkdir()
-        monkeypatch.setenv("HOME", str(tmp_path))
-
-        conn = get_connection(temp_workspace)
-        cursor = conn.cursor()
-
-        # Insert task with mixed file references (some inside, some outside workspace)
-        cursor.execute(
-            """
-            INSERT INTO tasks (
-                title, description, file_references, tags, status, created_at, updated_at
-            ) VALUES (?, ?, ?, ?, ?, datetime('now'), datetime('now'))
-            """,
-            (
-                "Test task with external refs",
-                "Task description",
-                json.dumps([
-                    f"{temp_workspace}/internal/file1.py",
-                    "/other/workspace/external/file2.py",
-                    "/completely/different/path/file3.py",
-                ]),
-                "test",
-                "todo",
-            ),
-        )
-
-        # Insert task with all internal file references
-        cursor.execute(
-            """
-            INSERT INTO tasks (
-                title, description, file_references, tags, status, created_at, updated_at
-            ) VALUES (?, ?, ?, ?, ?, datetime('now'), datetime('now'))
-            """,
-            (
-                "Clean task",
-                "No external references",
-                json.dumps([
-                    f"{temp_workspace}/src/auth.py",
-                    f"{temp_workspace}/tests/test_auth.py",
-                ]),
-                "clean",
-                "todo",
-            ),
-        )
+        assert _is_path_within(Path("/home/user/project-old/file.py"), parent) is False
+        assert _is_path_within(Path("/home/user/project/file.py"), Path("/")) is True
 
-        # Insert task with malformed JSON (should be handled gracefully)
-        cursor.execute(
-            """
-            INSERT INTO tasks (
-                title, description, file_references, tags, status, created_at, updated_at
-            ) VALUES (?, ?, ?, ?, ?, datetime('now'), datetime('now'))
-            """,
-            (
-                "Malformed task",
-                "Bad JSON",
-                "not-valid-json",
-                "malformed",
-                "todo",
-            ),
-        )
+    def test_is_path_within_resolve_cached(self) -> None:
+        """Test repeated containment checks reuse the cached resolution."""
+        _cached_resolve.cache_clear()
+        _dir_prefix.cache_clear()
+        parent = Path("/home/user/project")
 
-        conn.commit()
-        conn.close()
+        _is_path_within(Path("/home/user/project/a.py"), parent)
+        _is_path_within(Path("/home/user/project/b.py"), parent)
+        _is_path_within(Path("/home/user/project/a.py"), parent)
 
-        yield temp_workspace
+        assert _dir_prefix.cache_info().hits == 2
+        assert _cached_resolve.cache_info().hits == 1
 
-    def test_check_file_references_detects_external_paths(
-        self, setup_contaminated_db: str
+    def test_is_path_within_relative_follows_cwd(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
-        """Test file reference validation detects paths outside workspace."""
-        conn = get_connection(setup_contaminated_db)
-        cursor = conn.cursor()
+        """Test relative paths are re-anchored at the current cwd on every call."""
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
 
-        cursor.execute("SELECT * FROM tasks WHERE deleted_at IS NULL")
-        tasks = [dict(row) for row in cursor.fetchall()]
+        monkeypatch.chdir(tmp_path / "a")
+        assert _is_path_within(Path("sub/x.py"), tmp_path / "a") is True
 
-        report: dict[str, Any] = {"issues": {"file_reference_mismatches": []}}
-        _check_file_references(tasks, setup_contaminated_db, report)
+        monkeypatch.chdir(tmp_path / "b")
+        assert _is_path_within(Path("sub/x.py"), tmp_path / "a") is False
 
-        # Should find exactly 1 task with external references
-        assert len(report["issues"]["file_reference_mismatches"]) == 1
 
-        issue = report["issues"]["file_reference_mismatches"][0]
-        assert issue["task_title"] == "Test task with external refs"
-        assert "/other/workspace/external/file2.py" in issue["file_references"]
-        assert "/completely/different/path/file3.py" in issue["file_references"]
-        assert issue["severity"] == "high"
-        assert "expected_prefix" in issue
+class TestFileReferenceValidation:
+    """Test file reference contamination detection."""
 
-        conn.close()
+    @pytest.fixture(scope="class")
+    @classmethod
+    def setup_contaminated_db(
+        cls, temp_workspace: str
+    ) -> Generator[tuple[str, sqlite3.Connection], None, None]:
+        """Setup test database with contaminated file references."""
+        conn = _memory_conn()
+        conn.executemany(
+            TASK_INSERT_SQL,
+            [
+                # Task with mixed file references (some inside, some outside workspace)
+                (
+                    "Test task with external refs",
+                    "Task description",
+                    json.dumps([
+                        f"{temp_workspace}/internal/file1.py",
+                        "/other/workspace/external/file2.py",
+                        "/completely/different/path/file3.py",
+                    ]),
+                    "test",
+                    "todo",
+                ),
+                # Task with all internal file references
+                (
+                    "Clean task",
+                    "No external references",
+                    json.dumps([
+                        f"{temp_workspace}/src/auth.py",
+                        f"{temp_workspace}/tests/test_auth.py",
+                    ]),
+                    "clean",
+                    "todo",
+                ),
+                # Task with malformed JSON (should be handled gracefully)
+                ("Malformed task", "Bad JSON", "not-valid-json", "malformed", "todo"),
+            ],
+        )
+        conn.commit()
 
-    def test_check_file_references_handles_malformed_json(
-        self, setup_contaminated_db: str
+        try:
+            yield temp_workspace, conn
+        finally:
+            conn.close()
+
+    @pytest.mark.parametrize(
+        ("where", "params", "expected_titles", "expected_refs"),
+        [
+            pytest.param(
+                "deleted_at IS NULL",
+                (),
+                ["Test task with external refs"],
+                ["/other/workspace/external/file2.py", "/completely/different/path/file3.py"],
+                id="external",
+            ),
+            pytest.param("title = ?", ("Clean task",), [], [], id="clean"),
+            pytest.param("title = ?", ("Malformed task",), [], [], id="malformed"),
+        ],
+    )
+    def test_check_file_references(
+        self,
+        setup_contaminated_db: tuple[str, sqlite3.Connection],
+        where: str,
+        params: tuple[str, ...],
+        expected_titles: list[str],
+        expected_refs: list[str],
     ) -> None:
-        """Test file reference validation handles malformed JSON gracefully."""
-        conn = get_connection(setup_contaminated_db)
-        cursor = conn.cursor()
+        """Test file reference validation flags only paths outside workspace.
+
+        Malformed JSON is skipped silently rather than raising.
+        """
+        workspace, conn = setup_contaminated_db
+        tasks = _fetch_rows(conn, "tasks", TASK_COLS, where, params)
+
+        report = _issue_report("file_reference_mismatches")
+        _check_file_references(tasks, workspace, report)
+
+        issues = report["issues"]["file_reference_mismatches"]
+        assert [issue["task_title"] for issue in issues] == expected_titles
+        for ref in expected_refs:
+            assert sum(ref in issue["file_references"] for issue in issues) == 1
+        for issue in issues:
+            assert issue["severity"] == "high"
+            assert "expected_prefix" in issue
+
+    def test_check_file_references_uses_decoded_refs(self, temp_workspace: str) -> None:
+        """Test references decoded by perform_workspace_audit are not re-parsed."""
+        task = {
+            "id": 1,
+            "title": "Pre-decoded task",
+            "file_references": "not-valid-json",
+            "_file_refs": ["/other/workspace/decoded.py"],
+        }
 
-        cursor.execute("SELECT * FROM tasks WHERE deleted_at IS NULL")
-        tasks = [dict(row) for row in cursor.fetchall()]
+        report = _issue_report("file_reference_mismatches")
+        _check_file_references([task], temp_workspace, report)
 
-        report: dict[str, Any] = {"issues": {"file_reference_mismatches": []}}
+        issues = report["issues"]["file_reference_mismatches"]
+        assert [issue["file_references"] for issue in issues] == [
+            ["/other/workspace/decoded.py"]
+        ]
 
-        # Should not raise exception on malformed JSON
-        _check_file_references(tasks, setup_contaminated_db, report)
+    def test_check_file_references_parent_segments(self, temp_workspace: str) -> None:
+        """Test a reference escaping via '..' is flagged despite a shared prefix."""
+        escaping = f"{temp_workspace}/src/../../escape.py"
+        task = {
+            "id": 1,
+            "title": "Escaping task",
+            "file_references": json.dumps([f"{temp_workspace}/src/a.py", escaping]),
+        }
 
-        # Malformed task should be skipped silently
-        assert isinstance(report["issues"]["file_reference_mismatches"], list)
+        report = _issue_report("file_reference_mismatches")
+        _check_file_references([task], temp_workspace, report)
 
-        conn.close()
+        issues = report["issues"]["file_reference_mismatches"]
+        assert [issue["file_references"] for issue in issues] == [[escaping]]
 
-    def test_check_file_references_empty_workspace(
-        self, temp_workspace: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    def test_check_file_references_empty_workspace(self, temp_workspace: str) -> None:
         """Test file reference validation with empty workspace (no tasks)."""
-        # Point to temp directory for databases
-        test_home = tmp_path / ".task-mcp"
-        test_home.mkdir()
-        monkeypatch.setenv("HOME", str(tmp_path))
-
-        conn = get_connection(temp_workspace)
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM tasks WHERE deleted_at IS NULL")
-        tasks = [dict(row) for row in cursor.fetchall()]
+        conn = _memory_conn()
+        tasks = _fetch_rows(conn, "tasks", TASK_COLS)
 
-        report: dict[str, Any] = {"issues": {"file_reference_mismatches": []}}
+        report = _issue_report("file_reference_mismatches")
         _check_file_references(tasks, temp_workspace, report)
 
         # Should return empty list for empty workspace
@@ -225,344 +369,221 @@ class TestFileReferenceValidation:
 class TestSuspiciousTagDetection:
     """Test suspicious tag pattern detection."""
 
-    @pytest.fixture
-    def temp_workspace(self, tmp_path: Path) -> Generator[str, None, None]:
-        """Create temporary workspace for testing."""
-        workspace = str(tmp_path / "test-workspace")
-        Path(workspace).mkdir()
-        yield workspace
-
-    @pytest.fixture
+    @pytest.fixture(scope="class")
+    @classmethod
     def setup_tagged_db(
-        self, temp_workspace: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-    ) -> Generator[str, None, None]:
+        cls, temp_workspace: str
+    ) -> Generator[tuple[str, sqlite3.Connection], None, None]:
         """Setup test database with suspicious tags."""
-        # Point to temp directory for databases
-        test_home = tmp_path / ".task-mcp"
-        test_home.mkdir()
-        monkeypatch.setenv("HOME", str(tmp_path))
-
-        conn = get_connection(temp_workspace)
-        cursor = conn.cursor()
-
-        # Task with suspicious "other-project" tag
-        cursor.execute(
-            """
-            INSERT INTO tasks (
-                title, description, tags, status, created_at, updated_at
-            ) VALUES (?, ?, ?, ?, datetime('now'), datetime('now'))
-            """,
-            ("Task from other project", "Description", "test other-project backend", "todo"),
-        )
-
-        # Task with "task-viewer" tag (known separate project)
-        cursor.execute(
-            """
-            INSERT INTO tasks (
-                title, description, tags, status, created_at, updated_at
-            ) VALUES (?, ?, ?, ?, datetime('now'), datetime('now'))
-            """,
-            ("Task viewer feature", "Description", "frontend task-viewer", "todo"),
+        conn = _memory_conn()
+        conn.executemany(
+            TASK_INSERT_SQL,
+            [
+                # Task with suspicious "other-project" tag
+                ("Task from other project", "Description", None,
+                 "test other-project backend", "todo"),
+                # Task with "task-viewer" tag (known separate project)
+                ("Task viewer feature", "Description", None, "frontend task-viewer", "todo"),
+                # Task with clean tags (should not be flagged)
+                ("Clean task", "Description", None, "task-mcp backend testing", "todo"),
+                # Task with no tags
+                ("No tags task", "Description", None, None, "todo"),
+                # Task tagged with another MCP project
+                ("Other MCP task", "Description", None, "backend github-mcp", "todo"),
+                # Tag that merely contains a suspicious name (should not be flagged)
+                ("Adjacent tag task", "Description", None, "other-project-adjacent", "todo"),
+            ],
         )
-
-        # Task with clean tags (should not be flagged)
-        cursor.execute(
-            """
-            INSERT INTO tasks (
-                title, description, tags, status, created_at, updated_at
-            ) VALUES (?, ?, ?, ?, datetime('now'), datetime('now'))
-            """,
-            ("Clean task", "Description", "task-mcp backend testing", "todo"),
-        )
-
-        # Task with no tags
-        cursor.execute(
-            """
-            INSERT INTO tasks (
-                title, description, tags, status, created_at, updated_at
-            ) VALUES (?, ?, ?, ?, datetime('now'), datetime('now'))
-            """,
-            ("No tags task", "Description", None, "todo"),
-        )
-
         conn.commit()
-        conn.close()
-
-        yield temp_workspace
 
-    def test_check_suspicious_tags_detects_patterns(
-        self, setup_tagged_db: str
-    ) -> None:
-        """Test suspicious tag detection for known patterns."""
-        conn = get_connection(setup_tagged_db)
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT * FROM tasks WHERE deleted_at IS NULL")
-        tasks = [dict(row) for row in cursor.fetchall()]
-
-        report: dict[str, Any] = {"issues": {"suspicious_tags": []}}
-        _check_suspicious_tags(tasks, setup_tagged_db, report)
-
-        # Should detect 2 tasks with suspicious tags
-        assert len(report["issues"]["suspicious_tags"]) == 2
-
-        # Verify other-project detected
-        other_project_issues = [
-            i for i in report["issues"]["suspicious_tags"]
-            if "other-project" in i["tags"]
-        ]
-        assert len(other_project_issues) == 1
-        assert other_project_issues[0]["severity"] == "medium"
-
-        # Verify task-viewer detected
-        task_viewer_issues = [
-            i for i in report["issues"]["suspicious_tags"]
-            if "task-viewer" in i["tags"]
-        ]
-        assert len(task_viewer_issues) == 1
-
-        conn.close()
-
-    def test_check_suspicious_tags_ignores_clean_tags(
-        self, setup_tagged_db: str
+        try:
+            yield temp_workspace, conn
+        finally:
+            conn.close()
+
+    @pytest.mark.parametrize(
+        ("where", "params", "expected_titles", "expected_tags"),
+        [
+            pytest.param(
+                "deleted_at IS NULL",
+                (),
+                ["Task from other project", "Task viewer feature", "Other MCP task"],
+                ["other-project", "task-viewer", "github-mcp"],
+                id="suspicious",
+            ),
+            pytest.param("title = ?", ("Clean task",), [], [], id="clean"),
+            pytest.param("title = ?", ("No tags task",), [], [], id="untagged"),
+            pytest.param("title = ?", ("Adjacent tag task",), [], [], id="adjacent"),
+        ],
+    )
+    def test_check_suspicious_tags(
+        self,
+        setup_tagged_db: tuple[str, sqlite3.Connection],
+        where: str,
+        params: tuple[str, ...],
+        expected_titles: list[str],
+        expected_tags: list[str],
     ) -> None:
-        """Test suspicious tag detection ignores legitimate tags."""
-        conn = get_connection(setup_tagged_db)
-        cursor = conn.cursor()
+        """Test suspicious tag detection flags known patterns, not legitimate tags."""
+        workspace, conn = setup_tagged_db
+        tasks = _fetch_rows(conn, "tasks", TASK_COLS, where, params)
 
-        cursor.execute("SELECT * FROM tasks WHERE title = 'Clean task'")
-        tasks = [dict(row) for row in cursor.fetchall()]
+        report = _issue_report("suspicious_tags")
+        _check_suspicious_tags(tasks, workspace, report)
 
-        report: dict[str, Any] = {"issues": {"suspicious_tags": []}}
-        _check_suspicious_tags(tasks, setup_tagged_db, report)
-
-        # Should not flag legitimate task-mcp tag
-        assert len(report["issues"]["suspicious_tags"]) == 0
-
-        conn.close()
+        issues = report["issues"]["suspicious_tags"]
+        assert [issue["task_title"] for issue in issues] == expected_titles
+        for tag in expected_tags:
+            assert sum(tag in issue["tags"] for issue in issues) == 1
+        for issue in issues:
+            assert issue["severity"] == "medium"
 
 
 class TestDescriptionPathDetection:
     """Test description path reference detection."""
 
-    @pytest.fixture
-    def temp_workspace(self, tmp_path: Path) -> Generator[str, None, None]:
-        """Create temporary workspace for testing."""
-        workspace = str(tmp_path / "test-workspace")
-        Path(workspace).mkdir()
-        yield workspace
-
-    @pytest.fixture
+    @pytest.fixture(scope="class")
+    @classmethod
     def setup_description_db(
-        self, temp_workspace: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-    ) -> Generator[str, None, None]:
+        cls, temp_workspace: str
+    ) -> Generator[tuple[str, sqlite3.Connection], None, None]:
         """Setup test database with path references in descriptions."""
-        # Point to temp directory for databases
-        test_home = tmp_path / ".task-mcp"
-        test_home.mkdir()
-        monkeypatch.setenv("HOME", str(tmp_path))
-
-        conn = get_connection(temp_workspace)
-        cursor = conn.cursor()
-
-        # Task with external path in description
-        cursor.execute(
-            """
-            INSERT INTO tasks (
-                title, description, status, created_at, updated_at
-            ) VALUES (?, ?, ?, datetime('now'), datetime('now'))
-            """,
-            (
-                "Task with path reference",
-                "See /other/workspace/docs/design.md for details. "
-                "Also check /another/path/file.py for implementation.",
-                "todo",
-            ),
-        )
-
-        # Task with internal path (should not be flagged)
-        cursor.execute(
-            """
-            INSERT INTO tasks (
-                title, description, status, created_at, updated_at
-            ) VALUES (?, ?, ?, datetime('now'), datetime('now'))
-            """,
-            (
-                "Task with internal path",
-                f"Refer to {temp_workspace}/docs/internal.md for context.",
-                "todo",
-            ),
-        )
-
-        # Task with no paths in description
-        cursor.execute(
-            """
-            INSERT INTO tasks (
-                title, description, status, created_at, updated_at
-            ) VALUES (?, ?, ?, datetime('now'), datetime('now'))
-            """,
-            ("Clean description task", "Just a regular description with no paths.", "todo"),
+        conn = _memory_conn()
+        conn.executemany(
+            TASK_INSERT_SQL,
+            [
+                # Task with external path in description
+                (
+                    "Task with path reference",
+                    "See /other/workspace/docs/design.md for details. "
+                    "Also check /another/path/file.py for implementation.",
+                    None,
+                    None,
+                    "todo",
+                ),
+                # Task with internal path (should not be flagged)
+                (
+                    "Task with internal path",
+                    f"Refer to {temp_workspace}/docs/internal.md for context.",
+                    None,
+                    None,
+                    "todo",
+                ),
+                # Task with no paths in description
+                ("Clean description task", "Just a regular description with no paths.",
+                 None, None, "todo"),
+            ],
         )
-
         conn.commit()
-        conn.close()
-
-        yield temp_workspace
-
-    def test_check_description_paths_detects_external_paths(
-        self, setup_description_db: str
-    ) -> None:
-        """Test description path detection finds external absolute paths."""
-        conn = get_connection(setup_description_db)
-        cursor = conn.cursor()
 
-        cursor.execute("SELECT * FROM tasks WHERE deleted_at IS NULL")
-        tasks = [dict(row) for row in cursor.fetchall()]
-
-        report: dict[str, Any] = {"issues": {"description_path_references": []}}
-        _check_description_paths(tasks, setup_description_db, report)
-
-        # Should detect 1 task with external paths
-        assert len(report["issues"]["description_path_references"]) == 1
-
-        issue = report["issues"]["description_path_references"][0]
-        assert issue["task_title"] == "Task with path reference"
-        assert "/other/workspace/docs/design.md" in issue["detected_paths"]
-        assert "/another/path/file.py" in issue["detected_paths"]
-        assert issue["severity"] == "low"
-        assert "description_excerpt" in issue
-
-        conn.close()
-
-    def test_check_description_paths_ignores_internal_paths(
-        self, setup_description_db: str
+        try:
+            yield temp_workspace, conn
+        finally:
+            conn.close()
+
+    @pytest.mark.parametrize(
+        ("where", "params", "expected_titles", "expected_paths"),
+        [
+            pytest.param(
+                "deleted_at IS NULL",
+                (),
+                ["Task with path reference"],
+                ["/other/workspace/docs/design.md", "/another/path/file.py"],
+                id="external",
+            ),
+            pytest.param("title = ?", ("Task with internal path",), [], [], id="internal"),
+            pytest.param("title = ?", ("Clean description task",), [], [], id="no_paths"),
+        ],
+    )
+    def test_check_description_paths(
+        self,
+        setup_description_db: tuple[str, sqlite3.Connection],
+        where: str,
+        params: tuple[str, ...],
+        expected_titles: list[str],
+        expected_paths: list[str],
     ) -> None:
-        """Test description path detection ignores workspace-internal paths."""
-        conn = get_connection(setup_description_db)
-        cursor = conn.cursor()
+        """Test description path detection flags only external absolute paths."""
+        workspace, conn = setup_description_db
+        tasks = _fetch_rows(conn, "tasks", TASK_COLS, where, params)
 
-        cursor.execute("SELECT * FROM tasks WHERE title = 'Task with internal path'")
-        tasks = [dict(row) for row in cursor.fetchall()]
+        report = _issue_report("description_path_references")
+        _check_description_paths(tasks, workspace, report)
 
-        report: dict[str, Any] = {"issues": {"description_path_references": []}}
-        _check_description_paths(tasks, setup_description_db, report)
-
-        # Should not flag internal paths
-        assert len(report["issues"]["description_path_references"]) == 0
-
-        conn.close()
+        issues = report["issues"]["description_path_references"]
+        assert [issue["task_title"] for issue in issues] == expected_titles
+        for path in expected_paths:
+            assert sum(path in issue["detected_paths"] for issue in issues) == 1
+        for issue in issues:
+            assert issue["severity"] == "low"
+            assert "description_excerpt" in issue
 
 
 class TestEntityIdentifierValidation:
     """Test entity identifier contamination detection."""
 
-    @pytest.fixture
-    def temp_workspace(self, tmp_path: Path) -> Generator[str, None, None]:
-        """Create temporary workspace for testing."""
-        workspace = str(tmp_path / "test-workspace")
-        Path(workspace).mkdir()
-        yield workspace
-
-    @pytest.fixture
+    @pytest.fixture(scope="class")
+    @classmethod
     def setup_entity_db(
-        self, temp_workspace: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-    ) -> Generator[str, None, None]:
+        cls, temp_workspace: str
+    ) -> Generator[tuple[str, sqlite3.Connection], None, None]:
         """Setup test database with entity identifiers."""
-        # Point to temp directory for databases
-        test_home = tmp_path / ".task-mcp"
-        test_home.mkdir()
-        monkeypatch.setenv("HOME", str(tmp_path))
-
-        conn = get_connection(temp_workspace)
-        cursor = conn.cursor()
-
-        # File entity with external path identifier
-        cursor.execute(
-            """
-            INSERT INTO entities (
-                entity_type, name, identifier, created_at, updated_at
-            ) VALUES (?, ?, ?, datetime('now'), datetime('now'))
-            """,
-            ("file", "External File", "/other/workspace/src/external.py"),
-        )
-
-        # File entity with internal path identifier
-        cursor.execute(
-            """
-            INSERT INTO entities (
-                entity_type, name, identifier, created_at, updated_at
-            ) VALUES (?, ?, ?, datetime('now'), datetime('now'))
-            """,
-            ("file", "Internal File", f"{temp_workspace}/src/internal.py"),
+        conn = _memory_conn()
+        conn.executemany(
+            ENTITY_INSERT_SQL,
+            [
+                # File entity with external path identifier
+                ("file", "External File", "/other/workspace/src/external.py"),
+                # File entity with internal path identifier
+                ("file", "Internal File", f"{temp_workspace}/src/internal.py"),
+                # Non-file entity with code identifier (should be skipped)
+                ("other", "Vendor Entity", "ABC-INS"),
+                # File entity with no identifier (should be skipped)
+                ("file", "No Identifier", None),
+            ],
         )
-
-        # Non-file entity with code identifier (should be skipped)
-        cursor.execute(
-            """
-            INSERT INTO entities (
-                entity_type, name, identifier, created_at, updated_at
-            ) VALUES (?, ?, ?, datetime('now'), datetime('now'))
-            """,
-            ("other", "Vendor Entity", "ABC-INS"),
-        )
-
-        # File entity with no identifier (should be skipped)
-        cursor.execute(
-            """
-            INSERT INTO entities (
-                entity_type, name, identifier, created_at, updated_at
-            ) VALUES (?, ?, ?, datetime('now'), datetime('now'))
-            """,
-            ("file", "No Identifier", None),
-        )
-
         conn.commit()
-        conn.close()
-
-        yield temp_workspace
-
-    def test_check_entity_identifiers_detects_external_paths(
-        self, setup_entity_db: str
-    ) -> None:
-        """Test entity identifier validation detects external paths."""
-        conn = get_connection(setup_entity_db)
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT * FROM entities WHERE deleted_at IS NULL")
-        entities = [dict(row) for row in cursor.fetchall()]
-
-        report: dict[str, Any] = {"issues": {"entity_identifier_mismatches": []}}
-        _check_entity_identifiers(entities, setup_entity_db, report)
 
-        # Should detect 1 entity with external identifier
-        assert len(report["issues"]["entity_identifier_mismatches"]) == 1
-
-        issue = report["issues"]["entity_identifier_mismatches"][0]
-        assert issue["entity_type"] == "file"
-        assert issue["name"] == "External File"
-        assert issue["identifier"] == "/other/workspace/src/external.py"
-        assert issue["severity"] == "high"
-        assert "expected_prefix" in issue
-
-        conn.close()
-
-    def test_check_entity_identifiers_ignores_non_path_identifiers(
-        self, setup_entity_db: str
+        try:
+            yield temp_workspace, conn
+        finally:
+            conn.close()
+
+    @pytest.mark.parametrize(
+        ("where", "params", "expected_identifiers"),
+        [
+            pytest.param(
+                "deleted_at IS NULL",
+                (),
+                ["/other/workspace/src/external.py"],
+                id="external",
+            ),
+            pytest.param("name = ?", ("Internal File",), [], id="internal"),
+            pytest.param("identifier = ?", ("ABC-INS",), [], id="non_path"),
+            pytest.param("name = ?", ("No Identifier",), [], id="no_identifier"),
+        ],
+    )
+    def test_check_entity_identifiers(
+        self,
+        setup_entity_db: tuple[str, sqlite3.Connection],
+        where: str,
+        params: tuple[str, ...],
+        expected_identifiers: list[str],
     ) -> None:
-        """Test entity identifier validation skips non-path identifiers."""
-        conn = get_connection(setup_entity_db)
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT * FROM entities WHERE identifier = 'ABC-INS'")
-        entities = [dict(row) for row in cursor.fetchall()]
-
-        report: dict[str, Any] = {"issues": {"entity_identifier_mismatches": []}}
-        _check_entity_identifiers(entities, setup_entity_db, report)
+        """Test entity identifier validation flags only external file paths."""
+        workspace, conn = setup_entity_db
+        entities = _fetch_rows(conn, "entities", ENTITY_COLS, where, params)
 
-        # Should not flag non-path identifiers
-        assert len(report["issues"]["entity_identifier_mismatches"]) == 0
+        report = _issue_report("entity_identifier_mismatches")
+        _check_entity_identifiers(entities, workspace, report)
 
-        conn.close()
+        issues = report["issues"]["entity_identifier_mismatches"]
+        assert [issue["identifier"] for issue in issues] == expected_identifiers
+        for issue in issues:
+            assert issue["entity_type"] == "file"
+            assert issue["name"] == "External File"
+            assert issue["severity"] == "high"
+            assert "expected_prefix" in issue
 
 
 class TestGitConsistencyCheck:
@@ -578,7 +599,7 @@ class TestGitConsistencyCheck:
     def test_find_git_root_returns_root_path(self) -> None:
         """Test _find_git_root returns git repository root."""
         # Use current repository for testing
-        current_repo_root = _find_git_root(str(Path.cwd()))
+        current_repo_root = _find_git_root(str(_CWD))
 
         # Should return a path if in a git repo
         assert isinstance(current_repo_root, (str, type(None)))
@@ -595,6 +616,31 @@ class TestGitConsistencyCheck:
         result = _find_git_root(str(non_repo_path))
         assert result is None
 
+    @patch("task_mcp.audit.subprocess.run")
+    def test_find_git_root_skips_git_outside_repo(
+        self, mock_run: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test no git subprocess is spawned when no .git exists above the path."""
+        assert _find_git_root(str(tmp_path)) is None
+        mock_run.assert_not_called()
+
+    @patch("task_mcp.audit.subprocess.run")
+    def test_find_git_root_follows_symlink_into_repo(
+        self, mock_run: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test a symlinked workspace pointing into a repo subdirectory finds the repo."""
+        repo = tmp_path / "repo"
+        (repo / ".git").mkdir(parents=True)
+        (repo / "sub").mkdir()
+        link = tmp_path / "link"
+        link.symlink_to(repo / "sub")
+        mock_run.return_value = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout=f"{repo}\n", stderr=""
+        )
+
+        assert _find_git_root(str(link)) == str(repo)
+        mock_run.assert_called_once()
+
     @patch("task_mcp.audit.subprocess.run")
     def test_check_git_consistency_handles_subprocess_timeout(
         self, mock_run: MagicMock, temp_workspace: str
@@ -603,7 +649,7 @@ class TestGitConsistencyCheck:
         # Simulate timeout exception
         mock_run.side_effect = subprocess.TimeoutExpired(cmd="git", timeout=2)
 
-        report: dict[str, Any] = {"issues": {"git_repo_mismatches": []}}
+        report = _issue_report("git_repo_mismatches")
 
         # Should not raise exception
         git_info = _check_git_consistency([], [], temp_workspace, report)
@@ -619,7 +665,7 @@ class TestGitConsistencyCheck:
         # Simulate FileNotFoundError when git is not installed
         mock_run.side_effect = FileNotFoundError("git not found")
 
-        report: dict[str, Any] = {"issues": {"git_repo_mismatches": []}}
+        report = _issue_report("git_repo_mismatches")
 
         # Should handle gracefully without crashing
         git_info = _check_git_consistency([], [], temp_workspace, report)
@@ -669,18 +715,8 @@ class TestStatisticsCalculation:
 
     def test_calculate_statistics_empty_issues(self) -> None:
         """Test statistics calculation with no issues found."""
-        report: dict[str, Any] = {
-            "total_tasks": 10,
-            "total_entities": 5,
-            "issues": {
-                "file_reference_mismatches": [],
-                "suspicious_tags": [],
-                "description_path_references": [],
-                "entity_identifier_mismatches": [],
-                "git_repo_mismatches": [],
-            },
-            "statistics": {},
-        }
+        report = _issue_report(*ISSUE_KEYS)
+        report.update({"total_tasks": 10, "total_entities": 5, "statistics": {}})
 
         _calculate_statistics(report)
 
@@ -720,16 +756,8 @@ class TestRecommendationsGeneration:
 
     def test_generate_recommendations_no_issues(self) -> None:
         """Test recommendations generation with clean workspace."""
-        report: dict[str, Any] = {
-            "issues": {
-                "file_reference_mismatches": [],
-                "entity_identifier_mismatches": [],
-                "suspicious_tags": [],
-                "git_repo_mismatches": [],
-                "description_path_references": [],
-            },
-            "recommendations": [],
-        }
+        report = _issue_report(*ISSUE_KEYS)
+        report["recommendations"] = []
 
         _generate_recommendations(report)
 
@@ -742,145 +770,175 @@ class TestFullAuditWorkflow:
     """Integration tests for complete audit workflow."""
 
     @pytest.fixture
-    def temp_workspace(self, tmp_path: Path) -> Generator[str, None, None]:
-        """Create temporary workspace for testing."""
-        workspace = str(tmp_path / "test-workspace")
-        Path(workspace).mkdir()
-        yield workspace
-
-    @pytest.fixture
-    def setup_contaminated_workspace(
-        self, temp_workspace: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-    ) -> Generator[str, None, None]:
-        """Setup fully contaminated workspace for integration testing."""
-        # Point to temp directory for databases
-        test_home = tmp_path / ".task-mcp"
-        test_home.mkdir()
-        monkeypatch.setenv("HOME", str(tmp_path))
-
-        conn = get_connection(temp_workspace)
-        cursor = conn.cursor()
-
-        # Insert contaminated task with multiple issues
-        cursor.execute(
-            """
-            INSERT INTO tasks (
-                title, description, file_references, tags, status, created_at, updated_at
-            ) VALUES (?, ?, ?, ?, ?, datetime('now'), datetime('now'))
-            """,
-            (
-                "Contaminated task",
-                "See /other/workspace/design.md for details. "
-                "Implementation at /external/path/impl.py",
-                json.dumps([
-                    f"{temp_workspace}/internal.py",
-                    "/other/workspace/external.py",
-                ]),
-                "test other-project",
-                "todo",
-            ),
+    def audit_db(
+        self,
+        shared_audit_db: tuple[Path, str, sqlite3.Connection],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> tuple[str, sqlite3.Connection]:
+        """Reuse the session connection with every row from earlier tests removed."""
+        home, workspace, conn = shared_audit_db
+        monkeypatch.setenv("HOME", str(home))
+
+        conn.executescript(
+            "BEGIN; "
+            "DELETE FROM task_entity_links; DELETE FROM tasks; DELETE FROM entities; "
+            "COMMIT;"
         )
+        return workspace, conn
 
-        # Insert clean task
-        cursor.execute(
-            """
-            INSERT INTO tasks (
-                title, description, file_references, tags, status, created_at, updated_at
-            ) VALUES (?, ?, ?, ?, ?, datetime('now'), datetime('now'))
-            """,
-            (
-                "Clean task",
-                "Normal description",
-                json.dumps([f"{temp_workspace}/src/file.py"]),
-                "task-mcp testing",
-                "todo",
-            ),
-        )
+    @pytest.fixture
+    def seed_tasks(
+        self, audit_db: tuple[str, sqlite3.Connection]
+    ) -> Callable[..., None]:
+        """Return a helper inserting task rows in one transaction."""
+        _workspace, conn = audit_db
+
+        def seed(rows: list[tuple[str | None, ...]], *, deleted: bool = False) -> None:
+            with conn:
+                conn.executemany(DELETED_TASK_INSERT_SQL if deleted else TASK_INSERT_SQL, rows)
+
+        return seed
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def contaminated_snapshot(
+        cls, shared_audit_db: tuple[Path, str, sqlite3.Connection]
+    ) -> Generator[sqlite3.Connection, None, None]:
+        """Seed the contaminated workspace once per class into an in-memory snapshot."""
+        _home, temp_workspace, _conn = shared_audit_db
+        conn = _memory_conn()
+        with conn:
+            conn.executemany(
+                TASK_INSERT_SQL,
+                [
+                    # Contaminated task with multiple issues
+                    (
+                        "Contaminated task",
+                        "See /other/workspace/design.md for details. "
+                        "Implementation at /external/path/impl.py",
+                        json.dumps([
+                            f"{temp_workspace}/internal.py",
+                            "/other/workspace/external.py",
+                        ]),
+                        "test other-project",
+                        "todo",
+                    ),
+                    # Clean task
+                    (
+                        "Clean task",
+                        "Normal description",
+                        json.dumps([f"{temp_workspace}/src/file.py"]),
+                        "task-mcp testing",
+                        "todo",
+                    ),
+                ],
+            )
+            # Contaminated entity
+            conn.executemany(
+                ENTITY_INSERT_SQL,
+                [("file", "External Entity", "/other/workspace/entity.py")],
+            )
+
+        try:
+            yield conn
+        finally:
+            conn.close()
 
-        # Insert contaminated entity
-        cursor.execute(
-            """
-            INSERT INTO entities (
-                entity_type, name, identifier, created_at, updated_at
-            ) VALUES (?, ?, ?, datetime('now'), datetime('now'))
-            """,
-            ("file", "External Entity", "/other/workspace/entity.py"),
-        )
+    @pytest.fixture
+    def setup_contaminated_workspace(
+        self,
+        audit_db: tuple[str, sqlite3.Connection],
+        contaminated_snapshot: sqlite3.Connection,
+    ) -> tuple[str, sqlite3.Connection]:
+        """Setup fully contaminated workspace for integration testing.
+
+        Restores the class snapshot page-for-page with the SQLite backup API,
+        which is safe while connections to the shared database are open.
+        """
+        _workspace, conn = audit_db
+        contaminated_snapshot.backup(conn)
+        return audit_db
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def contaminated_report(
+        cls,
+        shared_audit_db: tuple[Path, str, sqlite3.Connection],
+        contaminated_snapshot: sqlite3.Connection,
+    ) -> dict[str, Any]:
+        """Audit the contaminated workspace once; the report tests share the result."""
+        home, workspace, conn = shared_audit_db
+        contaminated_snapshot.backup(conn)
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setenv("HOME", str(home))
+            return perform_workspace_audit(
+                workspace_path=workspace,
+                include_deleted=False,
+                check_git_repo=False,  # Skip git checks for deterministic testing
+            )
+
+    @pytest.mark.parametrize("key", REPORT_KEYS)
+    def test_report_structure(self, contaminated_report: dict[str, Any], key: str) -> None:
+        """Test the audit report carries every top-level section."""
+        assert key in contaminated_report
+
+    @pytest.mark.parametrize("key", ISSUE_KEYS)
+    def test_report_issue_categories(
+        self, contaminated_report: dict[str, Any], key: str
+    ) -> None:
+        """Test the audit report lists every issue category."""
+        assert key in contaminated_report["issues"]
 
-        conn.commit()
-        conn.close()
+    def test_report_contamination_detected(
+        self,
+        shared_audit_db: tuple[Path, str, sqlite3.Connection],
+        contaminated_report: dict[str, Any],
+    ) -> None:
+        """Test contamination and row totals are reported for the workspace."""
+        _home, workspace, _conn = shared_audit_db
+
+        assert contaminated_report["contamination_found"] is True
+        assert contaminated_report["workspace_path"] == workspace
+        assert contaminated_report["total_tasks"] == 2
+        assert contaminated_report["total_entities"] == 1
+
+    @pytest.mark.parametrize(
+        "key",
+        [
+            "file_reference_mismatches",
+            "suspicious_tags",
+            "description_path_references",
+            "entity_identifier_mismatches",
+        ],
+    )
+    def test_report_issues_detected(
+        self, contaminated_report: dict[str, Any], key: str
+    ) -> None:
+        """Test each seeded kind of contamination is detected."""
+        assert len(contaminated_report["issues"][key]) >= 1
 
-        yield temp_workspace
+    def test_report_statistics(self, contaminated_report: dict[str, Any]) -> None:
+        """Test statistics are calculated from the findings."""
+        statistics = contaminated_report["statistics"]
 
-    def test_perform_workspace_audit_full_workflow(
-        self, setup_contaminated_workspace: str
-    ) -> None:
-        """Test complete audit workflow with contaminated workspace."""
-        report = perform_workspace_audit(
-            workspace_path=setup_contaminated_workspace,
-            include_deleted=False,
-            check_git_repo=False,  # Skip git checks for deterministic testing
-        )
+        assert statistics["contaminated_tasks"] >= 1
+        assert statistics["contaminated_entities"] >= 1
+        assert statistics["contamination_percentage"] > 0
+        assert "high_severity_issues" in statistics
+        assert "medium_severity_issues" in statistics
+        assert "low_severity_issues" in statistics
 
-        # Verify report structure
-        assert "workspace_path" in report
-        assert "audit_timestamp" in report
-        assert "total_tasks" in report
-        assert "total_entities" in report
-        assert "contamination_found" in report
-        assert "issues" in report
-        assert "statistics" in report
-        assert "recommendations" in report
-
-        # Verify contamination detected
-        assert report["contamination_found"] is True
-        assert report["workspace_path"] == setup_contaminated_workspace
-        assert report["total_tasks"] == 2
-        assert report["total_entities"] == 1
-
-        # Verify issues structure
-        assert "file_reference_mismatches" in report["issues"]
-        assert "suspicious_tags" in report["issues"]
-        assert "description_path_references" in report["issues"]
-        assert "entity_identifier_mismatches" in report["issues"]
-        assert "git_repo_mismatches" in report["issues"]
-
-        # Verify at least some issues detected
-        assert len(report["issues"]["file_reference_mismatches"]) >= 1
-        assert len(report["issues"]["suspicious_tags"]) >= 1
-        assert len(report["issues"]["description_path_references"]) >= 1
-        assert len(report["issues"]["entity_identifier_mismatches"]) >= 1
-
-        # Verify statistics calculated
-        assert report["statistics"]["contaminated_tasks"] >= 1
-        assert report["statistics"]["contaminated_entities"] >= 1
-        assert report["statistics"]["contamination_percentage"] > 0
-        assert "high_severity_issues" in report["statistics"]
-        assert "medium_severity_issues" in report["statistics"]
-        assert "low_severity_issues" in report["statistics"]
-
-        # Verify recommendations generated
-        assert len(report["recommendations"]) > 0
+    def test_report_recommendations(self, contaminated_report: dict[str, Any]) -> None:
+        """Test recommendations are generated for a contaminated workspace."""
+        assert len(contaminated_report["recommendations"]) > 0
 
     def test_perform_workspace_audit_clean_workspace(
-        self, temp_workspace: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self, audit_db: tuple[str, sqlite3.Connection], seed_tasks: Callable[..., None]
     ) -> None:
         """Test audit workflow with clean workspace (no contamination)."""
-        # Point to temp directory for databases
-        test_home = tmp_path / ".task-mcp"
-        test_home.mkdir()
-        monkeypatch.setenv("HOME", str(tmp_path))
-
-        # Create clean database
-        conn = get_connection(temp_workspace)
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            INSERT INTO tasks (
-                title, description, file_references, tags, status, created_at, updated_at
-            ) VALUES (?, ?, ?, ?, ?, datetime('now'), datetime('now'))
-            """,
+        # Seed one clean task
+        temp_workspace, _conn = audit_db
+        seed_tasks([
             (
                 "Clean task",
                 "Normal description",
@@ -888,10 +946,7 @@ class TestFullAuditWorkflow:
                 "task-mcp testing",
                 "todo",
             ),
-        )
-
-        conn.commit()
-        conn.close()
+        ])
 
         report = perform_workspace_audit(
             workspace_path=temp_workspace,
@@ -910,41 +965,36 @@ class TestFullAuditWorkflow:
             assert len(issue_list) == 0
 
     def test_perform_workspace_audit_include_deleted(
-        self, setup_contaminated_workspace: str
+        self,
+        setup_contaminated_workspace: tuple[str, sqlite3.Connection],
+        seed_tasks: Callable[..., None],
     ) -> None:
         """Test audit workflow includes soft-deleted items when requested."""
         # Add a soft-deleted contaminated task
-        conn = get_connection(setup_contaminated_workspace)
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            INSERT INTO tasks (
-                title, description, file_references, tags, status, created_at, updated_at, deleted_at
-            ) VALUES (?, ?, ?, ?, ?, datetime('now'), datetime('now'), datetime('now'))
-            """,
-            (
-                "Deleted contaminated task",
-                "Deleted",
-                json.dumps(["/external/path/deleted.py"]),
-                "deleted",
-                "todo",
-            ),
+        workspace, _conn = setup_contaminated_workspace
+        seed_tasks(
+            [
+                (
+                    "Deleted contaminated task",
+                    "Deleted",
+                    json.dumps(["/external/path/deleted.py"]),
+                    "deleted",
+                    "todo",
+                ),
+            ],
+            deleted=True,
         )
 
-        conn.commit()
-        conn.close()
-
         # Audit without deleted items
         report_no_deleted = perform_workspace_audit(
-            workspace_path=setup_contaminated_workspace,
+            workspace_path=workspace,
             include_deleted=False,
             check_git_repo=False,
         )
 
         # Audit with deleted items
         report_with_deleted = perform_workspace_audit(
-            workspace_path=setup_contaminated_workspace,
+            workspace_path=workspace,
             include_deleted=True,
             check_git_repo=False,
         )
@@ -952,18 +1002,27 @@ class TestFullAuditWorkflow:
         # Should have more tasks when including deleted
         assert report_with_deleted["total_tasks"] > report_no_deleted["total_tasks"]
 
+    def test_perform_workspace_audit_clears_resolve_cache(
+        self, setup_contaminated_workspace: tuple[str, sqlite3.Connection]
+    ) -> None:
+        """Test path resolutions are not carried over to the next audit."""
+        workspace, _conn = setup_contaminated_workspace
+
+        perform_workspace_audit(
+            workspace_path=workspace,
+            include_deleted=False,
+            check_git_repo=False,
+        )
+
+        assert _cached_resolve.cache_info().currsize == 0
+        assert _dir_prefix.cache_info().currsize == 0
+
     def test_perform_workspace_audit_empty_workspace(
-        self, temp_workspace: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self, audit_db: tuple[str, sqlite3.Connection]
     ) -> None:
         """Test audit workflow with empty workspace (no tasks or entities)."""
-        # Point to temp directory for databases
-        test_home = tmp_path / ".task-mcp"
-        test_home.mkdir()
-        monkeypatch.setenv("HOME", str(tmp_path))
-
-        # Create empty database (just initialize schema)
-        conn = get_connection(temp_workspace)
-        conn.close()
+        # Database was just emptied by the fixture
+        temp_workspace, _conn = audit_db
 
         report = perform_workspace_audit(
             workspace_path=temp_workspace,
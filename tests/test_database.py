@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from collections.abc import Generator
 from pathlib import Path
 
@@ -11,6 +12,7 @@ from task_mcp.database import get_connection
 from task_mcp.master import get_master_connection, register_project
 from task_mcp.utils import (
     ensure_absolute_path,
+    get_project_db_info,
     hash_workspace_path,
     resolve_workspace,
     validate_description_length,
@@ -46,6 +48,27 @@ class TestUtils:
         assert hash1 == hash2  # Deterministic
         assert hash1.isalnum()
 
+    def test_hash_workspace_path_cached(self) -> None:
+        """Test repeat hashes of the same path are served from cache."""
+        hash_workspace_path.cache_clear()
+
+        first = hash_workspace_path("/cached/workspace/path")
+        second = hash_workspace_path("/cached/workspace/path")
+
+        assert first == second
+        assert hash_workspace_path.cache_info().hits == 1
+
+    def test_get_project_db_info(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the database path and project hash come from one resolution."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+
+        db_path, project_hash = get_project_db_info("/path/to/project")
+
+        assert project_hash == hash_workspace_path("/path/to/project")
+        assert db_path == tmp_path / ".task-mcp" / "databases" / f"project_{project_hash}.db"
+
     def test_validate_description_length_valid(self) -> None:
         """Test valid description length."""
         validate_description_length("x" * 10000)  # Should not raise
@@ -60,6 +83,27 @@ class TestUtils:
         result = ensure_absolute_path("relative/path")
         assert result.startswith("/")
 
+    def test_ensure_absolute_path_canonical_unchanged(self, tmp_path: Path) -> None:
+        """Test already-canonical absolute paths are returned as-is."""
+        canonical = os.path.realpath(tmp_path)
+
+        assert ensure_absolute_path(canonical) == canonical
+
+    def test_ensure_absolute_path_follows_repointed_symlink(self, tmp_path: Path) -> None:
+        """Test a re-pointed workspace symlink resolves to its new target."""
+        first = tmp_path / "first"
+        second = tmp_path / "second"
+        first.mkdir()
+        second.mkdir()
+        link = tmp_path / "workspace"
+
+        link.symlink_to(first)
+        assert ensure_absolute_path(str(link)) == os.path.realpath(first)
+
+        link.unlink()
+        link.symlink_to(second)
+        assert ensure_absolute_path(str(link)) == os.path.realpath(second)
+
 
 class TestDatabase:
     """Test database operations."""
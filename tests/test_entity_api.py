@@ -42,6 +42,8 @@ def api_key() -> str:
 def mock_env(api_key: str, monkeypatch: pytest.MonkeyPatch) -> None:
     """Set environment variables for testing."""
     monkeypatch.setenv("API_KEY", api_key)
+    # API key is read once at import, so patch the resolved constant too
+    monkeypatch.setattr("main._EXPECTED_API_KEY", api_key.encode())
     monkeypatch.setenv("HOST", "127.0.0.1")
     monkeypatch.setenv("PORT", "8001")
 
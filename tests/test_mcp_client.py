@@ -0,0 +1,153 @@
+"""Unit tests for the Task Viewer MCP client service.
+
+Tests tool dispatch in MCPClientService against a fake FastMCP instance:
+- Tools are resolved once when the service loads them
+- Sync and async tool functions are both supported
+- Sync tools run off the event loop thread
+- Unknown tools raise AttributeError
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+
+# Add task-viewer directory to path for imports
+task_viewer_path = Path(__file__).parent.parent / "task-viewer"
+sys.path.insert(0, str(task_viewer_path))
+
+from mcp_client import MCPClientService  # type: ignore[import]  # noqa: E402
+
+
+def _sync_tool(workspace_path: str) -> list[dict[str, Any]]:
+    return [{"id": 1, "workspace_path": workspace_path}]
+
+
+def _thread_tool(delay: float) -> int:
+    time.sleep(delay)
+    return threading.get_ident()
+
+
+async def _async_tool(task_id: int) -> dict[str, Any]:
+    return {"id": task_id}
+
+
+@pytest.fixture
+def fake_mcp() -> SimpleNamespace:
+    """Fake FastMCP instance exposing two tools."""
+    tools = {
+        "list_tasks": SimpleNamespace(
+            name="list_tasks", description="List tasks", fn=_sync_tool
+        ),
+        "get_task": SimpleNamespace(name="get_task", description=None, fn=_async_tool),
+        "thread_tool": SimpleNamespace(
+            name="thread_tool", description="Report thread", fn=_thread_tool
+        ),
+    }
+    return SimpleNamespace(
+        get_tool=AsyncMock(side_effect=tools.__getitem__),
+        get_tools=AsyncMock(return_value=tools),
+    )
+
+
+@pytest.fixture
+async def service(fake_mcp: SimpleNamespace) -> MCPClientService:
+    """MCP client service wired to the fake server."""
+    svc = MCPClientService()
+    svc._mcp = fake_mcp
+    await svc._load_tools()
+    svc._initialized = True
+    return svc
+
+
+class TestCallTool:
+    """Test MCPClientService.call_tool dispatch."""
+
+    async def test_call_sync_tool(self, service: MCPClientService) -> None:
+        """Test sync tool functions are called directly."""
+        result = await service.call_tool("list_tasks", {"workspace_path": "/ws"})
+
+        assert result == [{"id": 1, "workspace_path": "/ws"}]
+
+    async def test_call_async_tool_with_prefix(self, service: MCPClientService) -> None:
+        """Test async tools are awaited and the Claude Desktop prefix is stripped."""
+        result = await service.call_tool("mcp__task-mcp__get_task", {"task_id": 7})
+
+        assert result == {"id": 7}
+
+    async def test_tools_resolved_once(
+        self, service: MCPClientService, fake_mcp: SimpleNamespace
+    ) -> None:
+        """Test calls use the pre-resolved tools instead of get_tool."""
+        await service.call_tool("get_task", {"task_id": 1})
+        await service.call_tool("get_task", {"task_id": 2})
+
+        assert fake_mcp.get_tools.await_count == 1
+        assert fake_mcp.get_tool.await_count == 0
+
+    async def test_sync_tools_run_in_worker_threads(
+        self, service: MCPClientService
+    ) -> None:
+        """Test sync tools leave the event loop free and can run concurrently."""
+        start = time.perf_counter()
+        idents = await asyncio.gather(
+            service.call_tool("thread_tool", {"delay": 0.2}),
+            service.call_tool("thread_tool", {"delay": 0.2}),
+        )
+        elapsed = time.perf_counter() - start
+
+        assert threading.get_ident() not in idents
+        assert elapsed < 0.35
+
+    async def test_unknown_tool_raises(self, service: MCPClientService) -> None:
+        """Test unknown tool names raise AttributeError."""
+        with pytest.raises(
+            AttributeError,
+            match="Available tools: get_task, list_tasks, thread_tool",
+        ):
+            await service.call_tool("missing_tool")
+
+    async def test_not_initialized_raises(self) -> None:
+        """Test calling before initialize() raises RuntimeError."""
+        with pytest.raises(RuntimeError, match="not initialized"):
+            await MCPClientService().call_tool("list_tasks")
+
+
+class TestListAvailableTools:
+    """Test MCPClientService.list_available_tools."""
+
+    async def test_lists_loaded_tools(self, service: MCPClientService) -> None:
+        """Test every loaded tool is listed with its description."""
+        tools = await service.list_available_tools()
+
+        assert tools == [
+            {"name": "list_tasks", "description": "List tasks"},
+            {"name": "get_task", "description": ""},
+            {"name": "thread_tool", "description": "Report thread"},
+        ]
+
+
+class TestLifecycle:
+    """Test MCPClientService close/initialize cycles."""
+
+    async def test_close_then_initialize_reuses_tools(
+        self, service: MCPClientService, fake_mcp: SimpleNamespace
+    ) -> None:
+        """Test re-initializing after close() skips the import and tool load."""
+        await service.close()
+        with pytest.raises(RuntimeError, match="not initialized"):
+            await service.call_tool("list_tasks", {"workspace_path": "/ws"})
+
+        await service.initialize()
+
+        result = await service.call_tool("list_tasks", {"workspace_path": "/ws"})
+        assert result == [{"id": 1, "workspace_path": "/ws"}]
+        assert fake_mcp.get_tools.await_count == 1
@@ -21,6 +21,7 @@ get_task_tree = server.get_task_tree.fn
 cleanup_deleted_tasks = server.cleanup_deleted_tasks.fn
 list_projects = server.list_projects.fn
 get_project_info = server.get_project_info.fn
+get_task_stats = server.get_task_stats.fn
 set_project_name = server.set_project_name.fn
 
 
@@ -186,6 +187,30 @@ class TestAdvancedQueries:
         assert blocked[0]["blocker_reason"] == "Waiting for API key"
 
 
+    def test_get_task_stats(self, test_workspace: str) -> None:
+        """Test filtered counts, tag counts and blocker edges."""
+        blocker = create_task(
+            title="Blocker", priority="high", tags="api", workspace_path=test_workspace
+        )
+        create_task(
+            title="Dependent",
+            tags="api backend",
+            depends_on=[blocker["id"]],
+            workspace_path=test_workspace,
+        )
+        create_task(title="Done", status="done", workspace_path=test_workspace)
+
+        stats = get_task_stats(workspace_path=test_workspace, status="todo")
+
+        assert stats["total_count"] == 2
+        assert stats["status_counts"] == {"todo": 2}
+        assert stats["priority_counts"] == {"high": 1, "medium": 1}
+        assert stats["tag_counts"] == {"api": 2, "backend": 1}
+        assert len(stats["blockers"]) == 1
+        assert stats["blockers"][0]["id"] == blocker["id"]
+        assert len(stats["blockers"][0]["blocks_task_ids"]) == 1
+
+
 class TestSoftDelete:
     """Test soft delete functionality."""
 
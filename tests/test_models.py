@@ -84,6 +84,11 @@ class TestTaskHelperMethods:
         task = Task.model_construct(id=1, title="Test", status="todo")
         assert task.get_depends_on_list() == []
 
+    def test_get_depends_on_list_malformed(self) -> None:
+        """Test malformed stored depends_on JSON parses to an empty list."""
+        task = Task.model_construct(id=1, title="Test", depends_on="[1, 2", status="todo")
+        assert task.get_depends_on_list() == []
+
     def test_get_file_references_list(self) -> None:
         """Test parsing file_references JSON to list."""
         task = Task.model_construct(
@@ -113,6 +118,12 @@ class TestTagNormalization:
         """Test normalize_tags with None input."""
         assert normalize_tags(None) == ""  # type: ignore[arg-type]
 
+    def test_normalize_tags_already_normalized(self) -> None:
+        """Test lowercase-looking tags with other whitespace are still normalized."""
+        assert normalize_tags("api backend") == "api backend"
+        assert normalize_tags("api\tbackend") == "api backend"
+        assert normalize_tags("api\u3000backend\n") == "api backend"
+
 
 class TestStatusTransitions:
     """Test status transition validation."""
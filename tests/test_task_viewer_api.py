@@ -0,0 +1,609 @@
+"""Integration tests for Task Viewer project and task REST API endpoints.
+
+Tests the non-entity FastAPI endpoints including:
+- GET /health (unauthenticated)
+- GET /api/projects (list, pre-rendered)
+- GET /api/projects/{id}/info (stats, cached)
+- GET /api/tasks (pagination, filtering metadata)
+- GET /api/tasks/search
+- GET /api/tasks/{id} (routing vs. static task routes)
+- GET /api/tasks/{id}/tree
+
+Entity endpoints are covered separately in test_entity_api.py.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Generator
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, call, patch
+
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+
+# Add task-viewer directory to path for imports
+task_viewer_path = Path(__file__).parent.parent / "task-viewer"
+sys.path.insert(0, str(task_viewer_path))
+
+# Mock StaticFiles to avoid directory check during import
+with patch("starlette.staticfiles.StaticFiles"):
+    # Import FastAPI app and cache singleton
+    import main  # type: ignore[import]
+    from main import app  # type: ignore[import]
+    from response_cache import response_cache  # type: ignore[import]
+
+
+@pytest.fixture
+def api_key() -> str:
+    """Return valid API key for testing."""
+    return "test-api-key-12345"
+
+
+@pytest.fixture
+def mock_env(api_key: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Set environment variables for testing."""
+    monkeypatch.setenv("API_KEY", api_key)
+    # API key is read once at import, so patch the resolved constant too
+    monkeypatch.setattr("main._EXPECTED_API_KEY", api_key.encode())
+
+
+@pytest.fixture(autouse=True)
+def clear_response_cache() -> Generator[None, None, None]:
+    """Ensure cached responses never leak between tests."""
+    response_cache.clear()
+    main._last_good_project_info.clear()
+    yield
+    response_cache.clear()
+    main._last_good_project_info.clear()
+
+
+@pytest.fixture
+def test_project() -> dict[str, Any]:
+    """Create sample project for testing."""
+    return {
+        "id": "1e7be4ae",
+        "workspace_path": "/test/workspace/path",
+        "friendly_name": "Test Project",
+        "created_at": "2025-11-02T10:00:00",
+        "last_accessed": "2025-11-02T10:00:00",
+    }
+
+
+@pytest.fixture
+def mock_mcp_service() -> Generator[MagicMock, None, None]:
+    """Mock MCP service for testing without real MCP server."""
+    mock_service = MagicMock()
+    mock_service.initialize = AsyncMock()
+    mock_service.close = AsyncMock()
+    mock_service.call_tool = AsyncMock()
+
+    with patch("main.mcp_service", mock_service):
+        yield mock_service
+
+
+@pytest.fixture
+def mock_workspace_resolver(
+    test_project: dict[str, Any],
+) -> Generator[MagicMock, None, None]:
+    """Mock workspace resolver for testing."""
+    mock_resolver = MagicMock()
+    mock_resolver.initialize = AsyncMock()
+    mock_resolver.resolve = MagicMock(return_value="/test/workspace/path")
+    mock_resolver.get_project_count = MagicMock(return_value=1)
+    mock_resolver.get_project_by_id = MagicMock(return_value=test_project)
+    mock_resolver.list_projects = MagicMock(return_value=[test_project])
+    mock_resolver.get_projects_json = MagicMock(
+        return_value=orjson.dumps({"projects": [test_project], "total": 1})
+    )
+
+    with patch("main.workspace_resolver", mock_resolver):
+        yield mock_resolver
+
+
+@pytest.fixture
+def client(
+    mock_env: None,
+    mock_mcp_service: MagicMock,
+    mock_workspace_resolver: MagicMock,
+) -> TestClient:
+    """Create FastAPI test client with mocked dependencies."""
+    return TestClient(app)
+
+
+class TestHealthCheck:
+    """Test GET /health endpoint."""
+
+    def test_health_check_no_auth_required(
+        self, client: TestClient, mock_mcp_service: MagicMock
+    ) -> None:
+        """Test health check reports MCP status without an API key."""
+        mock_mcp_service._initialized = True
+
+        response = client.get("/health")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "healthy"
+        assert data["projects_loaded"] == 1
+
+
+class TestListProjects:
+    """Test GET /api/projects endpoint."""
+
+    def test_list_projects_success(
+        self, client: TestClient, api_key: str, test_project: dict[str, Any]
+    ) -> None:
+        """Test listing projects returns the resolver's pre-rendered body."""
+        response = client.get("/api/projects", headers={"X-API-Key": api_key})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 1
+        assert data["projects"][0]["id"] == test_project["id"]
+
+    def test_list_projects_served_verbatim(
+        self,
+        client: TestClient,
+        api_key: str,
+        mock_workspace_resolver: MagicMock,
+    ) -> None:
+        """Test the project list body is served without re-serialization."""
+        response = client.get("/api/projects", headers={"X-API-Key": api_key})
+
+        assert response.headers["content-type"] == "application/json"
+        assert response.content == mock_workspace_resolver.get_projects_json()
+        mock_workspace_resolver.list_projects.assert_not_called()
+
+    def test_list_projects_unauthorized(self, client: TestClient) -> None:
+        """Test missing API key is rejected before the handler runs."""
+        response = client.get("/api/projects")
+
+        assert response.status_code == 401
+
+
+class TestGetProjectInfo:
+    """Test GET /api/projects/{id}/info endpoint."""
+
+    def test_get_project_info_success(
+        self, client: TestClient, api_key: str, mock_mcp_service: MagicMock
+    ) -> None:
+        """Test project info includes task statistics from MCP."""
+        mock_mcp_service.call_tool.return_value = {
+            "total_tasks": 3,
+            "by_status": {"todo": 2, "done": 1},
+            "by_priority": {"high": 3},
+        }
+
+        response = client.get(
+            "/api/projects/1e7be4ae/info", headers={"X-API-Key": api_key}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["project"]["id"] == "1e7be4ae"
+        assert data["stats"]["total_tasks"] == 3
+        assert data["stats"]["by_status"] == {"todo": 2, "done": 1}
+
+    def test_get_project_info_served_from_cache(
+        self, client: TestClient, api_key: str, mock_mcp_service: MagicMock
+    ) -> None:
+        """Test repeated project info requests skip the MCP call."""
+        mock_mcp_service.call_tool.return_value = {
+            "total_tasks": 1,
+            "by_status": {"todo": 1},
+            "by_priority": {"medium": 1},
+        }
+
+        first = client.get(
+            "/api/projects/1e7be4ae/info", headers={"X-API-Key": api_key}
+        )
+        second = client.get(
+            "/api/projects/1e7be4ae/info", headers={"X-API-Key": api_key}
+        )
+
+        assert second.content == first.content
+        assert second.headers["content-type"] == "application/json"
+        assert mock_mcp_service.call_tool.await_count == 1
+
+    def test_get_project_info_error_not_cached(
+        self, client: TestClient, api_key: str, mock_mcp_service: MagicMock
+    ) -> None:
+        """Test failed stats lookups are retried on the next request."""
+        mock_mcp_service.call_tool.side_effect = RuntimeError("MCP unavailable")
+
+        response = client.get(
+            "/api/projects/1e7be4ae/info", headers={"X-API-Key": api_key}
+        )
+        assert response.status_code == 200
+        assert response.json()["stats"]["total_tasks"] == 0
+
+        client.get("/api/projects/1e7be4ae/info", headers={"X-API-Key": api_key})
+        assert mock_mcp_service.call_tool.await_count == 2
+
+    def test_get_project_info_serves_last_good_on_error(
+        self, client: TestClient, api_key: str, mock_mcp_service: MagicMock
+    ) -> None:
+        """Test MCP failures fall back to the last successful stats."""
+        mock_mcp_service.call_tool.return_value = {
+            "total_tasks": 4,
+            "by_status": {"todo": 4},
+            "by_priority": {"low": 4},
+        }
+        client.get("/api/projects/1e7be4ae/info", headers={"X-API-Key": api_key})
+
+        # Expire the fresh cache entry, then break task-mcp
+        response_cache.clear()
+        mock_mcp_service.call_tool.side_effect = RuntimeError("MCP unavailable")
+
+        response = client.get(
+            "/api/projects/1e7be4ae/info", headers={"X-API-Key": api_key}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["stats"]["total_tasks"] == 4
+        assert mock_mcp_service.call_tool.await_count == 2
+
+
+def _make_task(task_id: int, status: str, priority: str, **kwargs: Any) -> dict[str, Any]:
+    """Build a task dict shaped like the task-mcp list_tasks output."""
+    task = {
+        "id": task_id,
+        "title": f"Task {task_id}",
+        "status": status,
+        "priority": priority,
+        "created_by": "test-session",
+        "created_at": "2025-11-02T10:00:00",
+        "updated_at": "2025-11-02T10:00:00",
+    }
+    task.update(kwargs)
+    return task
+
+
+def _page(items: list[dict[str, Any]], total: int | None = None) -> dict[str, Any]:
+    """Wrap tasks in the paginated task-mcp response envelope."""
+    return {
+        "total_count": len(items) if total is None else total,
+        "returned_count": len(items),
+        "limit": 50,
+        "offset": 0,
+        "items": items,
+    }
+
+
+def _stats(
+    status_counts: dict[str, int] | None = None,
+    priority_counts: dict[str, int] | None = None,
+    tag_counts: dict[str, int] | None = None,
+    blockers: list[dict[str, Any]] | None = None,
+) -> dict[str, Any]:
+    """Build a get_task_stats result as returned by task-mcp."""
+    return {
+        "total_count": sum((status_counts or {}).values()),
+        "status_counts": status_counts or {},
+        "priority_counts": priority_counts or {},
+        "tag_counts": tag_counts or {},
+        "blockers": blockers or [],
+    }
+
+
+class TestListTasks:
+    """Test GET /api/tasks endpoint."""
+
+    def test_list_tasks_meta_counts(
+        self, client: TestClient, api_key: str, mock_mcp_service: MagicMock
+    ) -> None:
+        """Test meta counts come from the task-mcp stats call."""
+        mock_mcp_service.call_tool.side_effect = [
+            _page(
+                [
+                    _make_task(1, "todo", "high"),
+                    _make_task(2, "todo", "low", depends_on="[1]"),
+                ],
+                total=5,
+            ),
+            _stats(
+                status_counts={"todo": 3, "done": 2},
+                priority_counts={"high": 2, "low": 3},
+                blockers=[{"id": 1, "blocks_task_ids": [2]}],
+            ),
+        ]
+
+        response = client.get(
+            "/api/tasks",
+            params={"project_id": "1e7be4ae"},
+            headers={"X-API-Key": api_key},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 5
+        assert data["meta"]["status_counts"] == {"todo": 3, "done": 2}
+        assert data["meta"]["priority_counts"] == {"high": 2, "low": 3}
+        assert [t["is_blocker"] for t in data["tasks"]] == [True, False]
+
+    def test_list_tasks_marks_blockers(
+        self, client: TestClient, api_key: str, mock_mcp_service: MagicMock
+    ) -> None:
+        """Test blocker metadata is attached to tasks other tasks depend on."""
+        tasks = [
+            _make_task(1, "todo", "high"),
+            _make_task(2, "todo", "low", depends_on="[1]"),
+            _make_task(3, "blocked", "medium", depends_on="[1, 99]"),
+        ]
+        mock_mcp_service.call_tool.side_effect = [
+            _page(tasks),
+            _stats(
+                blockers=[
+                    {"id": 1, "blocks_task_ids": [2, 3]},
+                    {"id": 99, "blocks_task_ids": [3]},
+                ]
+            ),
+        ]
+
+        response = client.get(
+            "/api/tasks",
+            params={"project_id": "1e7be4ae"},
+            headers={"X-API-Key": api_key},
+        )
+
+        assert response.status_code == 200
+        returned = response.json()["tasks"]
+        assert returned[0]["is_blocker"] is True
+        assert returned[0]["blocks_task_ids"] == [2, 3]
+        assert returned[1]["is_blocker"] is False
+        assert returned[2]["blocks_task_ids"] == []
+
+    def test_list_tasks_paginates_in_mcp(
+        self, client: TestClient, api_key: str, mock_mcp_service: MagicMock
+    ) -> None:
+        """Test limit/offset go to task-mcp and meta uses the filtered stats call."""
+        mock_mcp_service.call_tool.side_effect = [
+            _page([_make_task(11, "todo", "high")], total=40),
+            _stats(status_counts={"todo": 40}, priority_counts={"high": 40}),
+        ]
+
+        response = client.get(
+            "/api/tasks",
+            params={"project_id": "1e7be4ae", "status": "todo", "limit": 1, "offset": 10},
+            headers={"X-API-Key": api_key},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 40
+        assert [t["id"] for t in data["tasks"]] == [11]
+        assert data["meta"]["status_counts"] == {"todo": 40}
+        assert mock_mcp_service.call_tool.await_args_list == [
+            call(
+                "list_tasks",
+                {
+                    "workspace_path": "/test/workspace/path",
+                    "status": "todo",
+                    "limit": 1,
+                    "offset": 10,
+                    "mode": "details",
+                },
+            ),
+            call(
+                "get_task_stats",
+                {"workspace_path": "/test/workspace/path", "status": "todo"},
+            ),
+        ]
+
+    def test_list_tasks_blocker_on_other_page(
+        self, client: TestClient, api_key: str, mock_mcp_service: MagicMock
+    ) -> None:
+        """Test tasks blocking tasks on later pages are still flagged."""
+        mock_mcp_service.call_tool.side_effect = [
+            _page([_make_task(1, "todo", "high")], total=2),
+            _stats(
+                priority_counts={"high": 1, "low": 1},
+                blockers=[{"id": 1, "blocks_task_ids": [2]}],
+            ),
+        ]
+
+        response = client.get(
+            "/api/tasks",
+            params={"project_id": "1e7be4ae", "limit": 1},
+            headers={"X-API-Key": api_key},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["tasks"][0]["is_blocker"] is True
+        assert data["tasks"][0]["blocks_task_ids"] == [2]
+        assert data["meta"]["priority_counts"] == {"high": 1, "low": 1}
+
+    def test_list_tasks_stats_error_degrades(
+        self, client: TestClient, api_key: str, mock_mcp_service: MagicMock
+    ) -> None:
+        """Test a stats error payload yields empty meta instead of a 400."""
+        mock_mcp_service.call_tool.side_effect = [
+            _page([_make_task(1, "todo", "high")]),
+            {"error": {"code": "RESPONSE_SIZE_EXCEEDED", "message": "Too large"}},
+        ]
+
+        response = client.get(
+            "/api/tasks",
+            params={"project_id": "1e7be4ae"},
+            headers={"X-API-Key": api_key},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [t["id"] for t in data["tasks"]] == [1]
+        assert data["tasks"][0]["is_blocker"] is False
+        assert data["meta"] == {"status_counts": {}, "priority_counts": {}}
+
+    def test_list_tasks_mcp_error(
+        self, client: TestClient, api_key: str, mock_mcp_service: MagicMock
+    ) -> None:
+        """Test task-mcp error payloads for the page itself surface as 400 responses."""
+        mock_mcp_service.call_tool.return_value = {
+            "error": {"code": "INVALID_MODE", "message": "Invalid mode"}
+        }
+
+        response = client.get(
+            "/api/tasks",
+            params={"project_id": "1e7be4ae"},
+            headers={"X-API-Key": api_key},
+        )
+
+        assert response.status_code == 400
+
+
+class TestGetTags:
+    """Test GET /api/tags endpoint."""
+
+    def test_get_tags_counts_from_stats(
+        self, client: TestClient, api_key: str, mock_mcp_service: MagicMock
+    ) -> None:
+        """Test tags come from task-mcp's server-side tag counts."""
+        mock_mcp_service.call_tool.return_value = _stats(tag_counts={"api": 1, "bugfix": 2})
+
+        response = client.get(
+            "/api/tags",
+            params={"project_id": "1e7be4ae"},
+            headers={"X-API-Key": api_key},
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "tags": [{"tag": "bugfix", "count": 2}, {"tag": "api", "count": 1}],
+            "total": 2,
+        }
+        mock_mcp_service.call_tool.assert_awaited_once_with(
+            "get_task_stats", {"workspace_path": "/test/workspace/path"}
+        )
+
+
+class TestSearchTasks:
+    """Test GET /api/tasks/search endpoint."""
+
+    def test_search_tasks_limit_passed_to_mcp(
+        self, client: TestClient, api_key: str, mock_mcp_service: MagicMock
+    ) -> None:
+        """Test search applies its limit in task-mcp and reports the full total."""
+        mock_mcp_service.call_tool.return_value = _page(
+            [_make_task(1, "todo", "high")], total=7
+        )
+
+        response = client.get(
+            "/api/tasks/search",
+            params={"q": "auth", "project_id": "1e7be4ae", "limit": 1},
+            headers={"X-API-Key": api_key},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 7
+        assert data["query"] == "auth"
+        assert len(data["tasks"]) == 1
+        args = mock_mcp_service.call_tool.await_args.args
+        assert args[0] == "search_tasks"
+        assert args[1]["limit"] == 1
+
+
+class TestTaskRouting:
+    """Test /api/tasks/{task_id} never shadows the static task routes."""
+
+    def test_get_task_by_id(
+        self, client: TestClient, api_key: str, mock_mcp_service: MagicMock
+    ) -> None:
+        """Test numeric IDs route to the task detail endpoint."""
+        mock_mcp_service.call_tool.return_value = _make_task(42, "todo", "high")
+
+        response = client.get(
+            "/api/tasks/42",
+            params={"project_id": "1e7be4ae"},
+            headers={"X-API-Key": api_key},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["id"] == 42
+        assert mock_mcp_service.call_tool.await_args.args[0] == "get_task"
+
+    def test_get_task_timestamps_verbatim(
+        self, client: TestClient, api_key: str, mock_mcp_service: MagicMock
+    ) -> None:
+        """Test task timestamps are returned exactly as task-mcp stores them."""
+        mock_mcp_service.call_tool.return_value = _make_task(
+            42, "done", "high", completed_at="2025-11-02 11:30:00"
+        )
+
+        response = client.get(
+            "/api/tasks/42",
+            params={"project_id": "1e7be4ae"},
+            headers={"X-API-Key": api_key},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["created_at"] == "2025-11-02T10:00:00"
+        assert response.json()["completed_at"] == "2025-11-02 11:30:00"
+
+    def test_static_route_not_captured_as_task_id(
+        self, client: TestClient, api_key: str, mock_mcp_service: MagicMock
+    ) -> None:
+        """Test /api/tasks/blocked reaches its own handler, not get_task."""
+        mock_mcp_service.call_tool.return_value = []
+
+        response = client.get(
+            "/api/tasks/blocked",
+            params={"project_id": "1e7be4ae"},
+            headers={"X-API-Key": api_key},
+        )
+
+        assert response.status_code == 200
+        assert mock_mcp_service.call_tool.await_args.args[0] == "get_blocked_tasks"
+
+    def test_non_numeric_task_id_not_found(
+        self, client: TestClient, api_key: str
+    ) -> None:
+        """Test non-numeric task IDs do not match any route."""
+        response = client.get("/api/tasks/abc", headers={"X-API-Key": api_key})
+
+        assert response.status_code == 404
+
+
+class TestGetTaskTree:
+    """Test GET /api/tasks/{task_id}/tree endpoint."""
+
+    def test_get_task_tree_nested_subtasks(
+        self, client: TestClient, api_key: str, mock_mcp_service: MagicMock
+    ) -> None:
+        """Test subtasks are returned recursively."""
+        grandchild = _make_task(3, "todo", "low", parent_task_id=2, subtasks=[])
+        child = _make_task(2, "todo", "low", parent_task_id=1, subtasks=[grandchild])
+        mock_mcp_service.call_tool.return_value = _make_task(
+            1, "in_progress", "high", subtasks=[child]
+        )
+
+        response = client.get(
+            "/api/tasks/1/tree",
+            params={"project_id": "1e7be4ae"},
+            headers={"X-API-Key": api_key},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["subtasks"][0]["id"] == 2
+        assert data["subtasks"][0]["subtasks"][0]["id"] == 3
+        assert data["subtasks"][0]["subtasks"][0]["subtasks"] == []
+
+    def test_get_task_omits_subtasks(
+        self, client: TestClient, api_key: str, mock_mcp_service: MagicMock
+    ) -> None:
+        """Test the flat task endpoint does not expose a subtasks field."""
+        mock_mcp_service.call_tool.return_value = _make_task(1, "todo", "high")
+
+        response = client.get(
+            "/api/tasks/1",
+            params={"project_id": "1e7be4ae"},
+            headers={"X-API-Key": api_key},
+        )
+
+        assert response.status_code == 200
+        assert "subtasks" not in response.json()
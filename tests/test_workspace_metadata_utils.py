@@ -4,6 +4,8 @@ import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
 from task_mcp.utils import (
     _get_git_root,
     _get_project_name,
@@ -216,3 +218,15 @@ def test_get_workspace_metadata_workspace_resolution() -> None:
         # Test with None (should raise ValueError in v0.4.0)
         with pytest.raises(ValueError, match="workspace_path is REQUIRED"):
             get_workspace_metadata(None)
+
+
+def test_cwd_at_creation_follows_chdir(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Verify cwd_at_creation reflects the working directory at call time."""
+    workspace = str(Path(__file__).parent.parent.resolve())
+
+    monkeypatch.chdir(tmp_path)
+    metadata = get_workspace_metadata(workspace)
+
+    assert metadata["cwd_at_creation"] == str(tmp_path.resolve())
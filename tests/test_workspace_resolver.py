@@ -0,0 +1,168 @@
+"""Unit tests for the Task Viewer workspace resolver.
+
+Tests WorkspaceResolver project caching:
+- Project IDs derived from workspace paths
+- Resolution by project ID, explicit path and default workspace
+- Pre-rendered project list body
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import orjson
+import pytest
+
+# Add task-viewer directory to path for imports
+task_viewer_path = Path(__file__).parent.parent / "task-viewer"
+sys.path.insert(0, str(task_viewer_path))
+
+from workspace_resolver import (  # type: ignore[import]  # noqa: E402
+    WorkspaceResolver,
+    _hash_path,
+)
+
+from task_mcp.utils import hash_workspace_path  # noqa: E402
+
+
+@pytest.fixture
+def projects() -> list[dict[str, Any]]:
+    """Projects as returned by the task-mcp list_projects tool."""
+    return [
+        {
+            "workspace_path": "/test/workspace/path",
+            "friendly_name": "Test Project",
+            "created_at": "2025-11-02T10:00:00",
+            "last_accessed": "2025-11-02T10:00:00",
+        }
+    ]
+
+
+@pytest.fixture
+async def resolver(projects: list[dict[str, Any]]) -> WorkspaceResolver:
+    """Resolver initialized against a mocked MCP service."""
+    mcp_service = MagicMock()
+    mcp_service.call_tool = AsyncMock(return_value=projects)
+
+    workspace_resolver = WorkspaceResolver()
+    await workspace_resolver.initialize(mcp_service)
+    return workspace_resolver
+
+
+class TestGenerateHashId:
+    """Test project ID generation."""
+
+    def test_hash_id_matches_task_mcp(self) -> None:
+        """Test IDs stay identical to task-mcp's SHA-256 project IDs."""
+        resolver = WorkspaceResolver()
+
+        assert resolver._generate_hash_id("/test/workspace/path") == (
+            hash_workspace_path("/test/workspace/path")
+        )
+        assert resolver._generate_hash_id("/test/workspace/path/") == (
+            hash_workspace_path("/test/workspace/path")
+        )
+
+    def test_hash_id_memoized(self) -> None:
+        """Test repeated paths hit the hash cache."""
+        _hash_path.cache_clear()
+        resolver = WorkspaceResolver()
+
+        resolver._generate_hash_id("/memo/path")
+        resolver._generate_hash_id("/memo/path/")
+
+        assert _hash_path.cache_info().hits == 1
+
+
+class TestProjectCache:
+    """Test project loading and lookup."""
+
+    async def test_resolve_by_project_id(self, resolver: WorkspaceResolver) -> None:
+        """Test cached projects resolve to their workspace path."""
+        project_id = resolver._generate_hash_id("/test/workspace/path")
+
+        assert resolver.resolve(project_id=project_id) == "/test/workspace/path"
+        assert resolver.get_project_count() == 1
+
+    async def test_get_project_by_id(self, resolver: WorkspaceResolver) -> None:
+        """Test project records are assembled with all cached fields."""
+        project_id = resolver._generate_hash_id("/test/workspace/path")
+
+        assert resolver.get_project_by_id(project_id) == {
+            "id": project_id,
+            "workspace_path": "/test/workspace/path",
+            "friendly_name": "Test Project",
+            "created_at": "2025-11-02T10:00:00",
+            "last_accessed": "2025-11-02T10:00:00",
+        }
+        assert resolver.get_project_by_id("deadbeef") is None
+
+    async def test_project_cache_read_only(self, resolver: WorkspaceResolver) -> None:
+        """Test the loaded cache cannot be mutated in place."""
+        with pytest.raises(TypeError):
+            resolver._project_cache["deadbeef"] = {}  # type: ignore[index]
+
+    async def test_unknown_project_id_raises(self, resolver: WorkspaceResolver) -> None:
+        """Test unknown project IDs raise ValueError listing known projects."""
+        project_id = resolver._generate_hash_id("/test/workspace/path")
+
+        with pytest.raises(
+            ValueError, match=rf"Available projects: {project_id} \(Test Project\)"
+        ):
+            resolver.resolve(project_id="deadbeef")
+
+    def test_unknown_project_id_without_projects(self) -> None:
+        """Test the error message reports no projects before initialize."""
+        with pytest.raises(ValueError, match="Available projects: none"):
+            WorkspaceResolver().resolve(project_id="deadbeef")
+
+
+class TestResolvePaths:
+    """Test explicit and default workspace path resolution."""
+
+    def test_explicit_path_resolves(self, tmp_path: Path) -> None:
+        """Test existing explicit paths resolve to themselves."""
+        assert WorkspaceResolver().resolve(workspace_path=str(tmp_path)) == str(tmp_path)
+
+    def test_explicit_path_created_later(self, tmp_path: Path) -> None:
+        """Test a workspace created after a failed lookup resolves without restart."""
+        resolver = WorkspaceResolver()
+        workspace = tmp_path / "late"
+
+        with pytest.raises(ValueError, match="does not exist"):
+            resolver.resolve(workspace_path=str(workspace))
+        workspace.mkdir()
+
+        assert resolver.resolve(workspace_path=str(workspace)) == str(workspace)
+
+    def test_missing_explicit_path_raises(self, tmp_path: Path) -> None:
+        """Test nonexistent explicit paths are rejected."""
+        with pytest.raises(ValueError, match="does not exist"):
+            WorkspaceResolver().resolve(workspace_path=str(tmp_path / "missing"))
+
+    def test_default_workspace_used(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the default workspace applies when nothing else is given."""
+        monkeypatch.setattr(
+            "workspace_resolver._DEFAULT_WORKSPACE_PATH", str(tmp_path)
+        )
+
+        assert WorkspaceResolver().resolve() == str(tmp_path)
+
+
+class TestProjectsJson:
+    """Test WorkspaceResolver.get_projects_json."""
+
+    async def test_projects_json_matches_list(self, resolver: WorkspaceResolver) -> None:
+        """Test the pre-rendered body mirrors list_projects."""
+        body = orjson.loads(resolver.get_projects_json())
+
+        assert body == {"projects": resolver.list_projects(), "total": 1}
+
+    async def test_projects_json_rendered_once(self, resolver: WorkspaceResolver) -> None:
+        """Test repeated calls return the same bytes object."""
+        assert resolver.get_projects_json() is resolver.get_projects_json()